@@ -0,0 +1,14 @@
+"""Shared FastAPI dependencies."""
+
+from fastapi import Request
+
+from .i18n import get_language
+
+
+def get_lang(request: Request) -> str:
+    """Resolve the response language from the Accept-Language header.
+
+    Use as ``lang: str = Depends(get_lang)`` on endpoints that return
+    translated text, instead of resolving it for every request in middleware.
+    """
+    return get_language(request.headers.get("accept-language"))
@@ -2,52 +2,80 @@
 Lightweight i18n for API responses.
 Uses JSON translation files consistent with frontend approach.
 """
-import json
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 _translations: dict[str, dict] = {}
-_fallback = "en"
+_flat: dict[str, dict[str, str]] = {}
+_EN = sys.intern("en")
+_KO = sys.intern("ko")
+_fallback = _EN
+
+def _flatten(prefix: str, node, out: dict[str, str]) -> None:
+    """Flatten a nested translation tree into dot-notation keys."""
+    if isinstance(node, dict):
+        for k, v in node.items():
+            _flatten(f"{prefix}.{k}" if prefix else k, v, out)
+    elif isinstance(node, str):
+        out[prefix] = node
+
+_LOCALES_DIR = Path(__file__).parent / "locales"
+# Available locale files by language code; only the fallback is parsed eagerly
+_available: dict[str, Path] = (
+    {sys.intern(f.stem): f for f in _LOCALES_DIR.glob("*.json")}
+    if _LOCALES_DIR.exists()
+    else {}
+)
+
+def _ensure_lang(lang: str) -> dict[str, str]:
+    """Load and flatten a locale on first use. Unknown languages cache as empty."""
+    flat = _flat.get(lang)
+    if flat is not None:
+        return flat
+    flat = {}
+    path = _available.get(lang)
+    if path is not None:
+        _translations[lang] = orjson.loads(path.read_bytes())
+        _flatten("", _translations[lang], flat)
+    if path is not None or len(_flat) < len(_available) + 16:
+        # Bound the negative cache so arbitrary codes can't grow it forever
+        _flat[lang] = flat
+    return flat
 
 def _load_translations():
-    global _translations
-    i18n_dir = Path(__file__).parent / "locales"
-    if not i18n_dir.exists():
-        return
-    for f in i18n_dir.glob("*.json"):
-        lang = f.stem
-        with open(f, "r", encoding="utf-8") as fh:
-            _translations[lang] = json.load(fh)
+    """Preload the fallback language; other locales load lazily in t()."""
+    _ensure_lang(_fallback)
 
 def t(key: str, lang: str = "en", **kwargs) -> str:
     """Translate a dot-notation key. Falls back to English."""
-    if not _translations:
-        _load_translations()
-    parts = key.split(".")
-    for try_lang in [lang, _fallback]:
-        node = _translations.get(try_lang, {})
-        for part in parts:
-            if isinstance(node, dict):
-                node = node.get(part)
-            else:
-                node = None
-                break
-        if node and isinstance(node, str):
-            if kwargs:
-                return node.format(**kwargs)
-            return node
-    return key
+    template = _ensure_lang(lang).get(key) or _ensure_lang(_fallback).get(key) or key
+    if kwargs:
+        return template.format(**kwargs)
+    return template
 
+@lru_cache(maxsize=1024)
 def get_language(accept_language: Optional[str] = None) -> str:
     """Extract preferred language from Accept-Language header."""
     if not accept_language:
         return _fallback
+    # Fast path: browsers list the preferred language first, so the leading
+    # characters are usually enough to decide without splitting the header.
+    head = accept_language.lstrip()[:2].lower()
+    if head == "ko":
+        return _KO
+    if head == "en":
+        return _EN
     for part in accept_language.split(","):
         lang = part.split(";")[0].strip().lower()
         if lang.startswith("ko"):
-            return "ko"
+            return _KO
         if lang.startswith("en"):
-            return "en"
+            return _EN
     return _fallback
 
+# Fallback locale is loaded eagerly at import
 _load_translations()
@@ -5,34 +5,52 @@ REST API endpoints for the React frontend.
 
 import subprocess
 from datetime import datetime
-from fastapi import FastAPI
+from pathlib import Path
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.clients.postgres_client import close_pg_pool, init_pg_pool
+
 from .routers import workout, fitness, auth, settings, admin, plans, profiles, intervals_oauth, webhooks
-from starlette.middleware.base import BaseHTTPMiddleware
-from .i18n import get_language
 
 app = FastAPI(
     title="AI Cycling Coach API",
     description="REST API for AI-powered cycling workout generation",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
-class LanguageMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
-        accept_lang = request.headers.get("accept-language", "en")
-        request.state.lang = get_language(accept_lang)
-        response = await call_next(request)
-        return response
-
-# Language detection middleware
-app.add_middleware(LanguageMiddleware)
-
 # Request logging middleware for admin monitoring (added BEFORE CORS)
-from .middleware import RequestLoggingMiddleware
+from .middleware import RequestLoggingMiddleware, start_log_writer, stop_log_writer
 
 app.add_middleware(RequestLoggingMiddleware)
 
+
+@app.on_event("startup")
+async def _start_log_writer():
+    """Start the background batch writer for request logs."""
+    app.state.log_writer = start_log_writer()
+
+
+@app.on_event("shutdown")
+async def _stop_log_writer():
+    """Flush queued request logs before the writer is stopped."""
+    await stop_log_writer(app.state.log_writer)
+
+
+@app.on_event("startup")
+async def _open_pg_pool():
+    """Open the direct Postgres pool for admin queries (if configured)."""
+    await init_pg_pool()
+
+
+@app.on_event("shutdown")
+async def _close_pg_pool():
+    await close_pg_pool()
+
+
 # CORS configuration - 분리 배포용
 # Vercel 프론트엔드에서 Render 백엔드로 요청 허용
 # NOTE: This must be the LAST middleware added (so it runs FIRST)
@@ -42,13 +60,17 @@ origins = [
     "http://localhost:3101",  # run.sh dev port (frontend)
     "http://localhost:8000",  # Default uvicorn
     "http://localhost:8005",  # Alternative dev port
-    "https://*.vercel.app",  # Vercel preview deployments
     "https://ai-cycling-workout-planner.vercel.app",  # Production
 ]
 
+# Vercel preview deployments. allow_origins does not expand wildcards, so
+# "https://*.vercel.app" never matched; scope the regex to this project only.
+origin_regex = r"https://ai-cycling-workout-planner(-[a-z0-9-]+)?\.vercel\.app"
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,  # Use specific origins instead of ["*"]
+    allow_origin_regex=origin_regex,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -68,12 +90,31 @@ app.include_router(webhooks.router, prefix="/api", tags=["webhooks"])
 
 
 def _get_git_info():
-    """Get git commit information at startup (env var > git command)."""
+    """Get git commit information at startup.
+
+    Resolution order: GIT_COMMIT env vars (set by the Docker build) > a
+    build-time ``version.json`` > ``git`` subprocesses, which are only spawned
+    when ALLOW_GIT_SUBPROCESS=1 (local development).
+    """
     import os
+    import json
     commit = os.environ.get("GIT_COMMIT")
     commit_date = os.environ.get("GIT_COMMIT_DATE")
     if commit and commit != "unknown":
         return {"commit": commit, "commit_date": commit_date or "unknown"}
+    version_file = Path(__file__).resolve().parent.parent / "version.json"
+    if version_file.exists():
+        try:
+            with open(version_file, "r", encoding="utf-8") as fh:
+                info = json.load(fh)
+            return {
+                "commit": info.get("commit") or "unknown",
+                "commit_date": info.get("commit_date") or "unknown",
+            }
+        except (OSError, ValueError):
+            pass
+    if os.environ.get("ALLOW_GIT_SUBPROCESS") != "1":
+        return {"commit": "unknown", "commit_date": "unknown"}
     try:
         commit = subprocess.check_output(
             ["git", "rev-parse", "--short", "HEAD"],
@@ -95,21 +136,26 @@ _git_info = _get_git_info()
 _start_time = datetime.utcnow().isoformat() + "Z"
 
 
-@app.get("/")
-async def root():
-    """Health check endpoint."""
-    return {"status": "ok", "service": "AI Cycling Coach API"}
-
-
-@app.get("/api/health")
-async def health():
-    """Health check for deployment."""
-    return {
+# Health responses never change after startup, so encode them once
+_ROOT_BYTES = orjson.dumps({"status": "ok", "service": "AI Cycling Coach API"})
+_HEALTH_BYTES = orjson.dumps(
+    {
         "status": "healthy",
         "version": app.version,
         "git_commit": _git_info["commit"],
         "git_commit_date": _git_info["commit_date"],
         "started_at": _start_time,
     }
+)
 
 
+@app.get("/")
+async def root():
+    """Health check endpoint."""
+    return Response(content=_ROOT_BYTES, media_type="application/json")
+
+
+@app.get("/api/health")
+async def health():
+    """Health check for deployment."""
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
@@ -3,14 +3,20 @@
 Logs all API requests to the database for admin monitoring.
 """
 
+import asyncio
 import time
-import json
-from typing import Optional, Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.types import ASGIApp
+from typing import Optional
 
-from src.clients.supabase_client import get_supabase_admin_client
+import orjson
+from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.clients.supabase_client import (
+    SUPABASE_JWT_SECRET,
+    decode_supabase_jwt,
+    get_supabase_admin_client,
+    get_supabase_auth_client,
+)
 
 
 # Paths to exclude from logging
@@ -22,54 +28,149 @@ EXCLUDED_PATHS = {
     "/favicon.ico",
 }
 
+# Request bodies are only logged when smaller than this (bytes)
+MAX_LOGGED_BODY_BYTES = 10000
+
+# Top-level body fields replaced with "[REDACTED]" before logging
+SENSITIVE_FIELDS = frozenset({"password", "api_key", "secret", "token"})
+
+# Pending api_request_logs rows, drained in batches by the log writer task
+LOG_QUEUE_MAXSIZE = 10000
+LOG_BATCH_SIZE = 100
+
+_log_queue: Optional[asyncio.Queue] = None
+_pending_tasks: set[asyncio.Task] = set()
+
+
+def _insert_logs(rows: list[dict]) -> None:
+    """Insert request log rows in a single round-trip (blocking)."""
+    supabase = get_supabase_admin_client()
+    supabase.table("api_request_logs").insert(rows).execute()
+
+
+def _write_batch(rows: list[dict]) -> None:
+    """Insert a batch of log rows, falling back to one insert per row (blocking).
+
+    A single bad row (e.g. a user_id FK to a deleted user) fails the whole
+    batch insert, so on failure each row is retried on its own and only the
+    rows that fail again are dropped.
+    """
+    try:
+        _insert_logs(rows)
+        return
+    except Exception as e:
+        if len(rows) == 1:
+            print(f"[MIDDLEWARE] Failed to log request: {e}")
+            return
+        print(f"[MIDDLEWARE] Batch of {len(rows)} logs failed, retrying per row: {e}")
+
+    for row in rows:
+        try:
+            _insert_logs([row])
+        except Exception as e:
+            print(f"[MIDDLEWARE] Failed to log {row.get('path')} request: {e}")
+
+
+async def _run_log_writer(queue: asyncio.Queue) -> None:
+    """Drain queued request logs and insert them in batches."""
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < LOG_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+        await asyncio.to_thread(_write_batch, batch)
+
+
+def start_log_writer() -> asyncio.Task:
+    """Create the log queue and start the batch writer on the running loop."""
+    global _log_queue
+    _log_queue = asyncio.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+    return asyncio.create_task(_run_log_writer(_log_queue))
+
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all API requests for admin monitoring."""
+async def stop_log_writer(writer: asyncio.Task) -> None:
+    """Flush every pending request log, then stop the batch writer.
+
+    Waits for in-flight ``_log_request`` tasks so their rows reach the queue,
+    takes whatever the writer hasn't picked up yet, cancels the writer and
+    inserts the remaining rows before returning.
+    """
+    if _pending_tasks:
+        await asyncio.gather(*list(_pending_tasks), return_exceptions=True)
+
+    remaining = []
+    if _log_queue is not None:
+        while not _log_queue.empty():
+            remaining.append(_log_queue.get_nowait())
+
+    writer.cancel()
+    try:
+        await writer
+    except asyncio.CancelledError:
+        pass
+
+    for start in range(0, len(remaining), LOG_BATCH_SIZE):
+        await asyncio.to_thread(_write_batch, remaining[start : start + LOG_BATCH_SIZE])
+
+
+class RequestLoggingMiddleware:
+    """Middleware to log all API requests for admin monitoring.
+
+    Implemented as a pure ASGI middleware: the status code is read from the
+    ``http.response.start`` message and the request body is teed from
+    ``receive`` as the app consumes it, so nothing is buffered up front.
+    """
 
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
         # Skip excluded paths
-        if request.url.path in EXCLUDED_PATHS or request.url.path.startswith("/docs"):
-            return await call_next(request)
+        path = scope["path"]
+        if path in EXCLUDED_PATHS or path.startswith("/docs"):
+            await self.app(scope, receive, send)
+            return
 
         # Start timing
         start_time = time.time()
 
         # Get request details
-        method = request.method
-        path = request.url.path
-        ip_address = request.client.host if request.client else None
+        request = Request(scope)
+        method = scope["method"]
+        client = scope.get("client")
+        ip_address = client[0] if client else None
         user_agent = request.headers.get("user-agent", "")[:500]  # Limit length
 
-        # Try to extract user_id from authorization header
-        user_id = await self._extract_user_id(request)
-
-        # Get request body for POST/PUT/PATCH (with size limit)
-        request_body = None
-        if method in ("POST", "PUT", "PATCH"):
-            try:
-                body = await request.body()
-                if len(body) < 10000:  # Only log if < 10KB
-                    request_body = json.loads(body.decode("utf-8"))
-                    # Remove sensitive fields
-                    for key in ["password", "api_key", "secret", "token"]:
-                        if key in request_body:
-                            request_body[key] = "[REDACTED]"
-            except Exception:
-                request_body = None
+        # Tee request body for POST/PUT/PATCH (with size limit)
+        capture_body = method in ("POST", "PUT", "PATCH") and self._should_capture_body(
+            request
+        )
+        body = bytearray()
+
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "http.request" and len(body) < MAX_LOGGED_BODY_BYTES:
+                body.extend(message.get("body", b""))
+            return message
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         # Process the request
-        response = None
         error_message = None
-        status_code = 500
 
         try:
-            response = await call_next(request)
-            status_code = response.status_code
+            await self.app(
+                scope, receive_wrapper if capture_body else receive, send_wrapper
+            )
         except Exception as e:
             error_message = str(e)[:1000]
             raise
@@ -79,19 +180,50 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
             # Log to database only for errors (fire and forget)
             if status_code >= 400:
-                await self._log_request(
-                    user_id=user_id,
-                    method=method,
-                    path=path,
-                    status_code=status_code,
-                    response_time_ms=response_time_ms,
-                    ip_address=ip_address,
-                    user_agent=user_agent,
-                    request_body=request_body,
-                    error_message=error_message,
+                task = asyncio.create_task(
+                    self._log_request(
+                        request=request,
+                        method=method,
+                        path=path,
+                        status_code=status_code,
+                        response_time_ms=response_time_ms,
+                        ip_address=ip_address,
+                        user_agent=user_agent,
+                        request_body=self._parse_body(bytes(body)) if capture_body else None,
+                        error_message=error_message,
+                    )
                 )
+                # Keep a reference so the task isn't garbage-collected mid-flight
+                _pending_tasks.add(task)
+                task.add_done_callback(_pending_tasks.discard)
 
-        return response
+    @staticmethod
+    def _parse_body(body: bytes) -> Optional[dict]:
+        """Parse a captured JSON body and redact sensitive fields."""
+        if not body or len(body) >= MAX_LOGGED_BODY_BYTES:
+            return None
+        try:
+            request_body = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return None
+        # Remove sensitive fields
+        if isinstance(request_body, dict):
+            request_body = {
+                k: "[REDACTED]" if k in SENSITIVE_FIELDS else v
+                for k, v in request_body.items()
+            }
+        return request_body
+
+    @staticmethod
+    def _should_capture_body(request: Request) -> bool:
+        """Only buffer small JSON bodies; skip uploads and oversized payloads."""
+        if not request.headers.get("content-type", "").startswith("application/json"):
+            return False
+        try:
+            content_length = int(request.headers.get("content-length", "0"))
+        except ValueError:
+            return False
+        return content_length < MAX_LOGGED_BODY_BYTES
 
     async def _extract_user_id(self, request: Request) -> Optional[str]:
         """Extract user ID from JWT token in Authorization header."""
@@ -99,10 +231,13 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             auth_header = request.headers.get("authorization", "")
             if auth_header.startswith("Bearer "):
                 token = auth_header[7:]
-                from src.clients.supabase_client import get_supabase_client
+                if SUPABASE_JWT_SECRET:
+                    # Verify locally - no Auth API round-trip per request
+                    claims = decode_supabase_jwt(token)
+                    return claims.get("sub") if claims else None
 
-                supabase = get_supabase_client()
-                user = supabase.auth.get_user(token)
+                supabase = get_supabase_auth_client()
+                user = await asyncio.to_thread(supabase.auth.get_user, token)
                 if user and user.user:
                     return user.user.id
         except Exception:
@@ -111,7 +246,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
     async def _log_request(
         self,
-        user_id: Optional[str],
+        request: Request,
         method: str,
         path: str,
         status_code: int,
@@ -121,9 +256,10 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         request_body: Optional[dict],
         error_message: Optional[str],
     ) -> None:
-        """Log request to database."""
+        """Queue request log for the batch writer (runs outside the request path)."""
         try:
-            supabase = get_supabase_admin_client()
+            # Resolve user_id only when the request is actually logged
+            user_id = await self._extract_user_id(request)
 
             log_data = {
                 "user_id": user_id,
@@ -137,7 +273,16 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 "error_message": error_message,
             }
 
-            supabase.table("api_request_logs").insert(log_data).execute()
+            if _log_queue is None:
+                # Writer not started (e.g. app used without startup events)
+                await asyncio.to_thread(_insert_logs, [log_data])
+            else:
+                try:
+                    _log_queue.put_nowait(log_data)
+                except asyncio.QueueFull:
+                    # Drop the oldest entry rather than block or grow unbounded
+                    _log_queue.get_nowait()
+                    _log_queue.put_nowait(log_data)
 
         except Exception as e:
             # Don't fail the request if logging fails
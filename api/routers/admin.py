@@ -4,49 +4,143 @@ Protected endpoints for admin/system monitoring.
 Requires admin authentication via ADMIN_SECRET environment variable.
 """
 
+import asyncio
+import hmac
 import os
-from typing import Optional
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Optional
+from uuid import UUID
 from fastapi import APIRouter, HTTPException, Header, Query, Depends
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from cachetools import TTLCache
+from pydantic import BaseModel, TypeAdapter
 
-from src.clients.supabase_client import get_supabase_admin_client
+from src.clients.supabase_client import (
+    decode_supabase_jwt,
+    get_supabase_admin_client,
+    get_supabase_auth_client,
+)
+from src.clients.postgres_client import get_pg_pool
+from ..services.cache_service import clear_admin_stats_cache, get_or_set_admin_stats
 
 
 router = APIRouter()
 
+# audit_logs partitions older than this are dropped (see cleanup-audit-logs)
+AUDIT_LOG_RETENTION_DAYS = 90
+
+# Read once at import (.env is loaded by supabase_client above)
+_ADMIN_SECRET = os.getenv("ADMIN_SECRET")
 
-def verify_admin_secret(x_admin_secret: Optional[str] = Header(None)) -> None:
-    """Verify admin secret from header."""
-    admin_secret = os.getenv("ADMIN_SECRET")
 
-    if not admin_secret:
+def verify_admin_secret(x_admin_secret: Optional[str] = Header(None)) -> None:
+    """Verify admin secret from header (constant-time comparison)."""
+    if not _ADMIN_SECRET:
         raise HTTPException(
             status_code=500, detail="ADMIN_SECRET not configured on server"
         )
 
-    if x_admin_secret != admin_secret:
+    if not hmac.compare_digest(
+        (x_admin_secret or "").encode(), _ADMIN_SECRET.encode()
+    ):
         raise HTTPException(status_code=401, detail="Invalid admin secret")
 
 
-def get_admin_user(authorization: Optional[str] = Header(None)) -> str:
-    """Dependency to verify admin user from JWT token."""
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Authorization required")
+@lru_cache(maxsize=4)
+def _utc_day_iso(day_number: int) -> str:
+    return datetime.fromtimestamp(day_number * 86400, timezone.utc).date().isoformat()
 
-    token = authorization[7:]
 
-    try:
-        from src.clients.supabase_client import get_supabase_client
+@lru_cache(maxsize=64)
+def _minute_minus_days(minute: int, days: int) -> datetime:
+    return datetime.fromtimestamp(minute * 60, timezone.utc) - timedelta(days=days)
 
-        supabase = get_supabase_client()
-        user = supabase.auth.get_user(token)
 
-        if not user or not user.user:
-            raise HTTPException(status_code=401, detail="Invalid token")
+def _today_iso() -> str:
+    """Current UTC date as YYYY-MM-DD (formatted once per day)."""
+    return _utc_day_iso(int(time.time()) // 86400)
+
+
+def _since_days(days: int) -> datetime:
+    """UTC cutoff ``days`` ago, truncated to the minute and memoized per minute."""
+    return _minute_minus_days(int(time.time()) // 60, days)
+
+
+def _jsonable(value: Any) -> Any:
+    """Render asyncpg values the way PostgREST returns them in JSON."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
 
+async def _rpc(name: str, params: Optional[dict] = None, scalar: bool = False) -> Any:
+    """Call a Postgres function, directly over the asyncpg pool when configured.
+
+    Falls back to the Supabase REST ``rpc`` call. Either way the result is
+    PostgREST-shaped: the value for scalar functions, otherwise row dicts.
+    """
+    params = params or {}
+    pool = get_pg_pool()
+
+    if pool is None:
+        supabase = get_supabase_admin_client()
+        rest_params = {k: _jsonable(v) for k, v in params.items()}
+        result = await asyncio.to_thread(supabase.rpc(name, rest_params).execute)
+        return result.data
+
+    args = ", ".join(f"{key} => ${i}" for i, key in enumerate(params, 1))
+    async with pool.acquire() as conn:
+        if scalar:
+            return await conn.fetchval(f"SELECT public.{name}({args})", *params.values())
+        rows = await conn.fetch(f"SELECT * FROM public.{name}({args})", *params.values())
+    return [{k: _jsonable(v) for k, v in row.items()} for row in rows]
+
+
+# Short-lived auth caches shared by the admin dependencies - a dashboard
+# session fires many admin requests with the same token
+ADMIN_AUTH_CACHE_TTL = 60
+
+_token_user_cache: TTLCache = TTLCache(maxsize=1024, ttl=ADMIN_AUTH_CACHE_TTL)
+_admin_flag_cache: TTLCache = TTLCache(maxsize=1024, ttl=ADMIN_AUTH_CACHE_TTL)
+_auth_cache_lock = threading.Lock()
+
+
+def _resolve_user(token: str) -> tuple[Optional[str], bool]:
+    """Resolve ``(user_id, is_admin_claim)`` for a JWT, verifying it locally when possible.
+
+    ``is_admin_claim`` is True only for a locally verified token carrying
+    ``app_metadata.is_admin`` (synced from user_settings by a DB trigger).
+    """
+    claims = decode_supabase_jwt(token)
+    if claims and claims.get("sub"):
+        app_metadata = claims.get("app_metadata") or {}
+        return claims["sub"], app_metadata.get("is_admin") is True
+
+    # Fall back to the Auth API (no secret configured, or local verify failed)
+
+    with _auth_cache_lock:
+        user_id = _token_user_cache.get(token)
+    if user_id is None:
+        supabase = get_supabase_auth_client()
+        user = supabase.auth.get_user(token)
+        if not user or not user.user:
+            return None, False
         user_id = user.user.id
+        with _auth_cache_lock:
+            _token_user_cache[token] = user_id
+    return user_id, False
+
 
-        # Check admin status
+def _lookup_is_admin(user_id: str) -> bool:
+    """Return the user's is_admin flag; lookup errors propagate uncached."""
+    with _auth_cache_lock:
+        is_admin = _admin_flag_cache.get(user_id)
+    if is_admin is None:
         admin_supabase = get_supabase_admin_client()
         result = (
             admin_supabase.table("user_settings")
@@ -55,8 +149,27 @@ def get_admin_user(authorization: Optional[str] = Header(None)) -> str:
             .single()
             .execute()
         )
+        is_admin = bool(result.data and result.data.get("is_admin", False))
+        with _auth_cache_lock:
+            _admin_flag_cache[user_id] = is_admin
+    return is_admin
 
-        if not result.data or not result.data.get("is_admin", False):
+
+def get_admin_user(authorization: Optional[str] = Header(None)) -> str:
+    """Dependency to verify admin user from JWT token."""
+    if not authorization or not authorization.startswith("Bearer "):
+        raise HTTPException(status_code=401, detail="Authorization required")
+
+    token = authorization[7:]
+
+    try:
+        user_id, admin_claim = _resolve_user(token)
+
+        if not user_id:
+            raise HTTPException(status_code=401, detail="Invalid token")
+
+        # Check admin status (JWT claim first, then user_settings)
+        if not admin_claim and not _lookup_is_admin(user_id):
             raise HTTPException(status_code=403, detail="Admin access required")
 
         return user_id
@@ -78,6 +191,9 @@ class AuditLogResponse(BaseModel):
     created_at: str
 
 
+_AUDIT_LOGS_ADAPTER = TypeAdapter(list[AuditLogResponse])
+
+
 class AuditLogsListResponse(BaseModel):
     """Response model for audit logs list."""
 
@@ -117,17 +233,8 @@ async def get_audit_logs(
 
     result = query.execute()
 
-    logs = [
-        AuditLogResponse(
-            id=log.get("id", ""),
-            event_type=log.get("event_type", ""),
-            user_id=log.get("user_id"),
-            details=log.get("details", {}),
-            ip_address=log.get("ip_address"),
-            created_at=log.get("created_at", ""),
-        )
-        for log in (result.data or [])
-    ]
+    # One compiled validator pass over the whole page instead of per-row models
+    logs = _AUDIT_LOGS_ADAPTER.validate_python(result.data or [])
 
     return AuditLogsListResponse(
         logs=logs,
@@ -147,15 +254,10 @@ async def get_audit_stats(
     """
     verify_admin_secret(x_admin_secret)
 
-    supabase = get_supabase_admin_client()
-
-    # Get all logs and count by type (Supabase doesn't support GROUP BY directly)
-    result = supabase.table("audit_logs").select("event_type").execute()
+    # GROUP BY runs in Postgres (see audit_log_event_counts migration)
+    rows = await _rpc("audit_log_event_counts")
 
-    event_counts: dict[str, int] = {}
-    for log in result.data or []:
-        event_type = log.get("event_type", "unknown")
-        event_counts[event_type] = event_counts.get(event_type, 0) + 1
+    event_counts: dict[str, int] = {row["event_type"]: row["n"] for row in rows or []}
 
     return {
         "event_counts": event_counts,
@@ -163,6 +265,39 @@ async def get_audit_stats(
     }
 
 
+# Rows removed per cleanup RPC call (keeps each DELETE transaction short)
+CLEANUP_BATCH_SIZE = 10000
+
+
+async def _delete_in_batches(table: str, rpc_name: str, cutoff_date: datetime) -> int:
+    """Drop expired daily partitions, then batch-delete the remainder.
+
+    Whole days go with a partition drop; the partial day and the default
+    partition are cleared by calling the batch-delete RPC until it removes
+    fewer rows than the batch size. Only row counts come back over the wire.
+    """
+    deleted_count = (
+        await _rpc(
+            "drop_log_partitions_before",
+            {"p_table": table, "p_cutoff": cutoff_date},
+            scalar=True,
+        )
+        or 0
+    )
+    while True:
+        batch_count = (
+            await _rpc(
+                rpc_name,
+                {"p_cutoff": cutoff_date, "p_batch_size": CLEANUP_BATCH_SIZE},
+                scalar=True,
+            )
+            or 0
+        )
+        deleted_count += batch_count
+        if batch_count < CLEANUP_BATCH_SIZE:
+            return deleted_count
+
+
 @router.delete("/admin/audit-logs/cleanup")
 async def cleanup_old_logs(
     x_admin_secret: Optional[str] = Header(None),
@@ -174,17 +309,12 @@ async def cleanup_old_logs(
     """
     verify_admin_secret(x_admin_secret)
 
-    from datetime import datetime, timedelta
-
-    cutoff_date = (datetime.utcnow() - timedelta(days=days_to_keep)).isoformat()
-
-    supabase = get_supabase_admin_client()
+    cutoff_date = _since_days(days_to_keep)
 
-    result = (
-        supabase.table("audit_logs").delete().lt("created_at", cutoff_date).execute()
+    deleted_count = await _delete_in_batches(
+        "audit_logs", "delete_audit_logs_batch", cutoff_date
     )
-
-    deleted_count = len(result.data or [])
+    clear_admin_stats_cache()
 
     return {
         "message": f"Deleted {deleted_count} logs older than {days_to_keep} days",
@@ -365,15 +495,7 @@ async def toggle_llm_model(
 async def verify_admin_user(user_id: str) -> bool:
     """Verify if a user has admin privileges."""
     try:
-        supabase = get_supabase_admin_client()
-        result = (
-            supabase.table("user_settings")
-            .select("is_admin")
-            .eq("user_id", user_id)
-            .single()
-            .execute()
-        )
-        return result.data.get("is_admin", False) if result.data else False
+        return _lookup_is_admin(user_id)
     except Exception:
         return False
 
@@ -391,65 +513,29 @@ async def get_overview_stats(
 
     Returns total users, workouts generated today, and API calls.
     """
-    from datetime import datetime, timedelta
-
-    supabase = get_supabase_admin_client()
-    today = datetime.utcnow().date().isoformat()
-    week_ago = (datetime.utcnow() - timedelta(days=7)).isoformat()
-
-    # Total users
-    users_result = supabase.table("user_settings").select("id", count="exact").execute()
-    total_users = users_result.count or 0
-
-    # Workouts generated today (from audit_logs)
-    workouts_result = (
-        supabase.table("audit_logs")
-        .select("id", count="exact")
-        .eq("event_type", "workout.generated")
-        .gte("created_at", today)
-        .execute()
+    today = _today_iso()
+    return await get_or_set_admin_stats(
+        "overview", today, lambda: _compute_overview_stats(today)
     )
-    workouts_today = workouts_result.count or 0
 
-    # API calls today
-    api_calls_result = (
-        supabase.table("api_request_logs")
-        .select("id", count="exact")
-        .gte("created_at", today)
-        .execute()
-    )
-    api_calls_today = api_calls_result.count or 0
 
-    # API calls this week
-    api_calls_week = (
-        supabase.table("api_request_logs")
-        .select("id", count="exact")
-        .gte("created_at", week_ago)
-        .execute()
-    )
+async def _compute_overview_stats(today: str) -> dict:
+    """Compute overview statistics (uncached)."""
+    today_start = datetime.fromisoformat(today).replace(tzinfo=timezone.utc)
+    week_ago = _since_days(7)
 
-    # Average response time today
-    response_times = (
-        supabase.table("api_request_logs")
-        .select("response_time_ms")
-        .gte("created_at", today)
-        .execute()
+    # All five figures come back from one RPC (see admin_overview_stats migration)
+    rows = await _rpc(
+        "admin_overview_stats", {"p_today": today_start, "p_week_ago": week_ago}
     )
-    avg_response_time = 0
-    if response_times.data:
-        times = [
-            r.get("response_time_ms", 0)
-            for r in response_times.data
-            if r.get("response_time_ms")
-        ]
-        avg_response_time = sum(times) // len(times) if times else 0
+    stats = rows[0] if rows else {}
 
     return {
-        "total_users": total_users,
-        "workouts_today": workouts_today,
-        "api_calls_today": api_calls_today,
-        "api_calls_week": api_calls_week.count or 0,
-        "avg_response_time_ms": avg_response_time,
+        "total_users": stats.get("total_users") or 0,
+        "workouts_today": stats.get("workouts_today") or 0,
+        "api_calls_today": stats.get("api_calls_today") or 0,
+        "api_calls_week": stats.get("api_calls_week") or 0,
+        "avg_response_time_ms": stats.get("avg_response_time_ms") or 0,
     }
 
 
@@ -462,139 +548,85 @@ async def get_user_stats(
 
     Returns user signup trends and active users.
     """
-    from datetime import datetime, timedelta
-
-    supabase = get_supabase_admin_client()
-    cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
-
-    # Get signups from audit logs
-    signups = (
-        supabase.table("audit_logs")
-        .select("created_at")
-        .eq("event_type", "user.signup")
-        .gte("created_at", cutoff)
-        .order("created_at", desc=False)
-        .execute()
+    return await get_or_set_admin_stats(
+        "users", str(days), lambda: _compute_user_stats(days)
     )
 
-    # Group by date
-    daily_signups: dict[str, int] = {}
-    for log in signups.data or []:
-        date = log.get("created_at", "")[:10]
-        daily_signups[date] = daily_signups.get(date, 0) + 1
-
-    # Active users (have made API calls in last 7 days)
-    week_ago = (datetime.utcnow() - timedelta(days=7)).isoformat()
-    active_users = (
-        supabase.table("api_request_logs")
-        .select("user_id")
-        .gte("created_at", week_ago)
-        .not_.is_("user_id", "null")
-        .execute()
-    )
 
-    unique_active = len(
-        set(log.get("user_id") for log in active_users.data or [] if log.get("user_id"))
+async def _compute_user_stats(days: int) -> dict:
+    """Compute user statistics (uncached)."""
+    cutoff = _since_days(days)
+    week_ago = _since_days(7)
+
+    # Signups from audit logs + active users (API calls in last 7 days),
+    # fetched concurrently
+    signups, active_users = await asyncio.gather(
+        _rpc(
+            "daily_event_counts", {"p_event_type": "user.signup", "p_cutoff": cutoff}
+        ),
+        _rpc("active_user_count_since", {"p_since": week_ago}, scalar=True),
     )
 
+    # Already grouped by date in Postgres
+    daily_signups: dict[str, int] = {row["d"]: row["n"] for row in signups or []}
+
     return {
         "daily_signups": daily_signups,
-        "active_users_last_7_days": unique_active,
-        "total_signups_period": len(signups.data or []),
+        "active_users_last_7_days": active_users or 0,
+        "total_signups_period": sum(daily_signups.values()),
     }
 
 
 @router.get("/admin/stats/workouts")
 async def get_workout_stats(
     admin_user_id: str = Depends(get_admin_user),
-    days: int = Query(30, ge=1, le=365),
+    days: int = Query(30, ge=1, le=AUDIT_LOG_RETENTION_DAYS),
 ):
     """Get workout generation statistics.
 
-    Returns daily workout counts and trends.
+    Returns daily workout counts and trends. Per-user counts are read from raw
+    audit_logs, so ``days`` is capped at its retention to keep them consistent
+    with the daily totals.
     """
-    from datetime import datetime, timedelta
-
-    supabase = get_supabase_admin_client()
-    cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
-
-    # Get workout generations from audit logs
-    workouts = (
-        supabase.table("audit_logs")
-        .select("created_at, user_id, details")
-        .eq("event_type", "workout.generated")
-        .gte("created_at", cutoff)
-        .order("created_at", desc=False)
-        .execute()
+    return await get_or_set_admin_stats(
+        "workouts", str(days), lambda: _compute_workout_stats(days)
     )
 
-    # Group by date
-    daily_workouts: dict[str, int] = {}
-    for log in workouts.data or []:
-        date = log.get("created_at", "")[:10]
-        daily_workouts[date] = daily_workouts.get(date, 0) + 1
-
-    # Synced workouts
-    synced = (
-        supabase.table("audit_logs")
-        .select("id", count="exact")
-        .eq("event_type", "workout.sync_success")
-        .gte("created_at", cutoff)
-        .execute()
+
+async def _compute_workout_stats(days: int) -> dict:
+    """Compute workout generation statistics (uncached)."""
+    cutoff = _since_days(days)
+
+    # Daily + per-user workout counts and daily synced counts, fetched
+    # concurrently. Daily counts come from the admin_daily_event_counts rollup.
+    workout_params = {"p_event_type": "workout.generated", "p_cutoff": cutoff}
+    synced_params = {"p_event_type": "workout.sync_success", "p_cutoff": cutoff}
+    daily, per_user, synced = await asyncio.gather(
+        _rpc("daily_event_counts", workout_params),
+        _rpc("event_user_counts", workout_params),
+        _rpc("daily_event_counts", synced_params),
     )
 
-    # Count workouts per user
-    user_counts: dict[str, int] = {}
-    for log in workouts.data or []:
-        user_id = log.get("user_id")
-        if user_id:
-            user_counts[user_id] = user_counts.get(user_id, 0) + 1
-
-    # Find top user
-    top_user = None
-    top_count = 0
-    if user_counts:
-        top_user = max(user_counts, key=lambda x: user_counts[x])
-        top_count = user_counts[top_user]
-
-    # Get user emails for display (from audit_logs details if available)
-    user_emails: dict[str, str] = {}
-    # Extract emails from audit_logs details if present
-    for log in workouts.data or []:
-        user_id = log.get("user_id")
-        details = log.get("details", {})
-        if user_id and isinstance(details, dict):
-            email = details.get("email") or details.get("user_email")
-            if email:
-                user_emails[user_id] = email
-
-    # Build per-user stats with emails
+    daily_workouts: dict[str, int] = {row["d"]: row["n"] for row in daily or []}
+
+    # Per-user stats with emails (from audit_logs details if available),
+    # already sorted by count descending
     user_stats = [
         {
-            "user_id": uid,
-            "email": user_emails.get(uid, uid[:8] + "..."),
-            "count": count,
+            "user_id": row["user_id"],
+            "email": row.get("email") or row["user_id"][:8] + "...",
+            "count": row["n"],
         }
-        for uid, count in sorted(user_counts.items(), key=lambda x: -x[1])
+        for row in per_user or []
     ]
 
     return {
         "daily_workouts": daily_workouts,
-        "total_generated": len(workouts.data or []),
-        "total_synced": synced.count or 0,
+        "total_generated": sum(daily_workouts.values()),
+        "total_synced": sum(row["n"] for row in synced or []),
         "user_stats": user_stats,
-        "top_user": (
-            {
-                "user_id": top_user,
-                "email": user_emails.get(
-                    top_user, top_user[:8] + "..." if top_user else None
-                ),
-                "count": top_count,
-            }
-            if top_user
-            else None
-        ),
-        "unique_users": len(user_counts),
+        "top_user": user_stats[0] if user_stats else None,
+        "unique_users": len(user_stats),
     }
 
 
@@ -617,13 +649,24 @@ class ApiLogResponse(BaseModel):
     created_at: str
 
 
+_API_LOGS_ADAPTER = TypeAdapter(list[ApiLogResponse])
+
+# Only the columns ApiLogResponse exposes (skips request_body / user_agent)
+_API_LOG_COLUMNS = ",".join(ApiLogResponse.model_fields)
+
+
 class ApiLogsListResponse(BaseModel):
     """Response model for API logs list."""
 
     logs: list[ApiLogResponse]
-    total: int
+    # None on cursor pages (count is skipped). May be estimated: PostgREST
+    # counts exactly on small tables and uses the planner estimate on big ones
+    total: Optional[int]
     page: int
     page_size: int
+    # Keyset cursor for the next page (pass back as before_created_at/before_id)
+    next_before_created_at: Optional[str] = None
+    next_before_id: Optional[str] = None
 
 
 @router.get("/admin/api-logs", response_model=ApiLogsListResponse)
@@ -635,51 +678,72 @@ async def get_api_logs(
     path_contains: Optional[str] = Query(None),
     status_code: Optional[int] = Query(None),
     user_id: Optional[str] = Query(None),
+    before_created_at: Optional[datetime] = Query(None),
+    before_id: Optional[UUID] = Query(None),
 ):
-    """Get API request logs with pagination and filtering."""
+    """Get API request logs with pagination and filtering.
+
+    Pass ``before_created_at`` + ``before_id`` (the ``next_before_*`` values of
+    the previous response) for keyset pagination, which seeks straight to the
+    page via the (created_at, id) index instead of scanning ``offset`` rows.
+    ``page`` is still honoured when no cursor is given.
+    """
     supabase = get_supabase_admin_client()
+    use_cursor = before_created_at is not None and before_id is not None
 
-    # Build query
-    query = supabase.table("api_request_logs").select("*", count="exact")
+    # Build query. Offset pages get an estimated count: PostgREST counts exactly
+    # below its threshold and falls back to the planner estimate on big tables,
+    # instead of a full COUNT(*) per page.
+    query = supabase.table("api_request_logs").select(
+        _API_LOG_COLUMNS, count=None if use_cursor else "estimated"
+    )
 
     # Apply filters
     if method:
         query = query.eq("method", method)
     if path_contains:
+        # Served by the idx_api_logs_path_trgm GIN index
         query = query.ilike("path", f"%{path_contains}%")
     if status_code:
         query = query.eq("status_code", status_code)
     if user_id:
         query = query.eq("user_id", user_id)
 
-    # Apply pagination
-    offset = (page - 1) * page_size
-    query = query.order("created_at", desc=True).range(offset, offset + page_size - 1)
+    # Apply pagination (id breaks created_at ties so the cursor is stable)
+    query = query.order("created_at", desc=True).order("id", desc=True)
+    if use_cursor:
+        # Both values are parsed by FastAPI, so their formatted forms can't
+        # contain PostgREST filter syntax
+        cursor_at = before_created_at.isoformat()
+        cursor_id = str(before_id)
+        query = query.or_(
+            f'created_at.lt."{cursor_at}",'
+            f'and(created_at.eq."{cursor_at}",id.lt."{cursor_id}")'
+        ).limit(page_size)
+    else:
+        offset = (page - 1) * page_size
+        query = query.range(offset, offset + page_size - 1)
 
     result = query.execute()
 
-    logs = [
-        ApiLogResponse(
-            id=log.get("id", ""),
-            user_id=log.get("user_id"),
-            method=log.get("method", ""),
-            path=log.get("path", ""),
-            status_code=log.get("status_code"),
-            response_time_ms=log.get("response_time_ms"),
-            ip_address=log.get("ip_address"),
-            error_message=log.get("error_message"),
-            created_at=log.get("created_at", ""),
-        )
-        for log in (result.data or [])
-    ]
+    # One compiled validator pass over the whole page instead of per-row models
+    logs = _API_LOGS_ADAPTER.validate_python(result.data or [])
 
-    return ApiLogsListResponse(
+    last = logs[-1] if len(logs) == page_size else None
+
+    response = ApiLogsListResponse(
         logs=logs,
-        total=result.count or 0,
+        total=None if use_cursor else (result.count or 0),
         page=page,
         page_size=page_size,
+        next_before_created_at=last.created_at if last else None,
+        next_before_id=last.id if last else None,
     )
 
+    # Dump once and hand the dict straight to orjson; returning a Response
+    # skips FastAPI's second response_model validation + jsonable_encoder pass
+    return ORJSONResponse(response.model_dump(mode="json"))
+
 
 @router.delete("/admin/api-logs/cleanup")
 async def cleanup_api_logs(
@@ -687,20 +751,12 @@ async def cleanup_api_logs(
     days_to_keep: int = Query(30, ge=1, le=365),
 ):
     """Delete API logs older than specified days."""
-    from datetime import datetime, timedelta
-
-    cutoff_date = (datetime.utcnow() - timedelta(days=days_to_keep)).isoformat()
+    cutoff_date = _since_days(days_to_keep)
 
-    supabase = get_supabase_admin_client()
-
-    result = (
-        supabase.table("api_request_logs")
-        .delete()
-        .lt("created_at", cutoff_date)
-        .execute()
+    deleted_count = await _delete_in_batches(
+        "api_request_logs", "delete_api_request_logs_batch", cutoff_date
     )
-
-    deleted_count = len(result.data or [])
+    clear_admin_stats_cache()
 
     return {
         "message": f"Deleted {deleted_count} logs older than {days_to_keep} days",
@@ -727,28 +783,15 @@ async def check_admin_status(
     token = authorization[7:]
 
     try:
-        from src.clients.supabase_client import get_supabase_client
-
-        supabase = get_supabase_client()
-        user = supabase.auth.get_user(token)
+        user_id, admin_claim = _resolve_user(token)
 
-        if not user or not user.user:
+        if not user_id:
             return {"is_admin": False}
 
-        user_id = user.user.id
-
-        admin_supabase = get_supabase_admin_client()
-        result = (
-            admin_supabase.table("user_settings")
-            .select("is_admin")
-            .eq("user_id", user_id)
-            .single()
-            .execute()
-        )
-
-        is_admin = result.data.get("is_admin", False) if result.data else False
-
-        return {"is_admin": is_admin, "user_id": user_id}
+        return {
+            "is_admin": admin_claim or _lookup_is_admin(user_id),
+            "user_id": user_id,
+        }
 
     except Exception:
         return {"is_admin": False}
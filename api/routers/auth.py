@@ -1,20 +1,45 @@
 """Authentication router using Supabase."""
 
-import os
+import threading
+import time
+
+from cachetools import TLRUCache
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from jose import JWTError, jwt
 from pydantic import BaseModel, EmailStr
 from typing import Optional
 
-import sys
-
-sys.path.insert(
-    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
+from src.clients.supabase_client import decode_supabase_jwt, get_supabase_auth_client
 
 router = APIRouter()
 security = HTTPBearer()
 
+# Tokens verified through the Supabase Auth API (no local JWT secret, or a
+# token the secret could not verify): access token -> (user info, exp). Short
+# TTL so revoked sessions stop working within a minute, and never past the
+# token's own expiry.
+AUTH_CACHE_TTL = 60
+
+
+def _verified_user_ttu(_token: str, entry: tuple, now: float) -> float:
+    _user_info, exp = entry
+    ttl = AUTH_CACHE_TTL if exp is None else min(AUTH_CACHE_TTL, exp - time.time())
+    return now + ttl  # Already-expired tokens (ttl <= 0) are not stored
+
+
+_verified_user_cache: TLRUCache = TLRUCache(maxsize=4096, ttu=_verified_user_ttu)
+_verified_user_lock = threading.Lock()
+
+
+def _token_exp(token: str) -> Optional[float]:
+    """The token's ``exp`` claim (unverified; Supabase has verified the token)."""
+    try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+    except JWTError:
+        return None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
 
 # --- Schemas ---
 
@@ -54,19 +79,40 @@ def _get_supabase_client():
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> dict:
-    """Verify JWT token and return user info."""
+    """Verify JWT token and return user info.
+
+    Verifies the token locally with SUPABASE_JWT_SECRET when configured and
+    only falls back to the Supabase Auth API if local verification fails.
+    Tokens verified remotely are cached for AUTH_CACHE_TTL seconds (capped at
+    their expiry), so polling requests (e.g. cached fitness data) don't
+    round-trip to Supabase each time.
+    """
     token = credentials.credentials
-    supabase = _get_supabase_client()
+
+    claims = decode_supabase_jwt(token)
+    if claims and claims.get("sub"):
+        return {"id": claims["sub"], "email": claims.get("email")}
+
+    with _verified_user_lock:
+        cached = _verified_user_cache.get(token)
+    if cached is not None:
+        return cached[0]
+
+    supabase = get_supabase_auth_client()
 
     try:
         # Verify token with Supabase
         user = supabase.auth.get_user(token)
         if not user or not user.user:
             raise HTTPException(status_code=401, detail="Invalid token")
-        return {"id": user.user.id, "email": user.user.email}
+        user_info = {"id": user.user.id, "email": user.user.email}
     except Exception as e:
         raise HTTPException(status_code=401, detail=f"Authentication failed: {str(e)}")
 
+    with _verified_user_lock:
+        _verified_user_cache[token] = (user_info, _token_exp(token))
+    return user_info
+
 
 # --- Endpoints ---
 
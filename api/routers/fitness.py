@@ -1,9 +1,11 @@
 """Fitness router - CTL/ATL/TSB and wellness data."""
 
 import asyncio
+from typing import Awaitable, Callable, Iterator, Optional
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
 from datetime import date, timedelta
+from pydantic import BaseModel
 
 from ..schemas import (
     FitnessResponse,
@@ -20,30 +22,145 @@ from ..schemas import (
     HRZone,
 )
 
-import sys
-
-sys.path.insert(0, str(__file__).replace("/api/routers/fitness.py", ""))
-
 from src.clients.intervals import IntervalsAPIError
 from .auth import get_current_user
 from ..services.user_api_service import (
+    cleanup_stale_workouts,
     get_user_intervals_client,
+    sync_workouts_from_intervals,
     UserApiServiceError,
 )
 from ..services.fitness_snapshot_service import (
+    get_cached_athlete_data,
     get_cached_athlete_profile,
     get_fitness_snapshot,
+    select_sport_settings,
 )
+from ..services.blocking import run_intervals
 from ..services.cache_service import (
-    get_cached,
+    CACHE_KEYS,
+    get_or_compute,
+    get_or_compute_json,
     set_cached,
 )
 
 router = APIRouter()
 
+# Intervals.icu event category for planned workouts
+_WORKOUT = "WORKOUT"
+
+# Intervals.icu activity types recorded on a trainer / virtual platform
+_VIRTUAL_TYPES = frozenset({"VirtualRide", "VirtualRun", "VirtualRow", "VirtualSki"})
+
+# Labels for zones Intervals.icu returns as bare [min, max] pairs
+_POWER_ZONE_NAMES = (
+    "Recovery",
+    "Endurance",
+    "Tempo",
+    "Threshold",
+    "VO2max",
+    "Anaerobic",
+    "Neuromuscular",
+)
+_HR_ZONE_NAMES = ("Recovery", "Endurance", "Tempo", "Threshold", "VO2max")
+
+# Intervals.icu fields read per row; extracted with map(row.get, ...) so the
+# lookups run in C and missing keys come back as None
+_ACTIVITY_FIELDS = (
+    "id",
+    "start_date_local",
+    "name",
+    "type",
+    "moving_time",
+    "icu_training_load",
+    "distance",
+)
+_WEEKLY_EVENT_FIELDS = (
+    "id",
+    "start_date_local",
+    "name",
+    "type",
+    "moving_time",
+    "icu_training_load",
+    "trainer",
+    "description",
+)
+
+# WellnessMetrics fields copied as-is from the DataProcessor snapshot
+_WELLNESS_COPIED_FIELDS = tuple(
+    name
+    for name in WellnessMetrics.model_fields
+    if name not in ("rhr", "vo2max", "active_calories_history")
+)
+
+
+# One raw activities window is cached per user and sliced for shorter requests
+RAW_ACTIVITIES_DAYS = 60
+
+
+async def _get_raw_activities(
+    user_id: str, config, days: int, refresh: bool = False
+) -> list[dict]:
+    """Raw Intervals.icu activities from the last ``days`` days.
+
+    Windows up to RAW_ACTIVITIES_DAYS are served from a shared per-user cache
+    (invalidated by the activity webhooks); longer ones go upstream directly.
+    """
+    if days > RAW_ACTIVITIES_DAYS:
+        return await run_intervals(
+            user_id, config, lambda c: c.get_recent_activities(days=days)
+        )
+
+    # /activities and /weekly-calendar load together, so share the fetch
+    raw = await get_or_compute(
+        user_id,
+        CACHE_KEYS["activities_raw"],
+        lambda: run_intervals(
+            user_id,
+            config,
+            lambda c: c.get_recent_activities(days=RAW_ACTIVITIES_DAYS),
+        ),
+        refresh=refresh,
+    )
+
+    if days == RAW_ACTIVITIES_DAYS:
+        return raw
+    # Same inclusive lower bound as IntervalsClient.get_recent_activities
+    oldest = (date.today() - timedelta(days=days)).isoformat()
+    return [a for a in raw if (a.get("start_date_local") or "")[:10] >= oldest]
+
+
+async def _cached_json(
+    request: Request,
+    user_id: str,
+    cache_key: str,
+    load: Callable[[], Awaitable[BaseModel]],
+    refresh: bool,
+) -> Response:
+    """Serve ``load``'s model through the per-user JSON body cache.
+
+    Concurrent misses share one load and stale data is served if it fails.
+    Remaining errors map to 400 (user API setup), 502 (Intervals.icu) or 500.
+    """
+    try:
+        return await get_or_compute_json(
+            user_id,
+            cache_key,
+            load,
+            refresh=refresh,
+            if_none_match=request.headers.get("if-none-match"),
+        )
+    except UserApiServiceError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except IntervalsAPIError as e:
+        raise HTTPException(status_code=502, detail=f"Intervals.icu API error: {e}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 
 @router.get("/fitness", response_model=FitnessResponse)
 async def get_fitness(
+    request: Request,
     refresh: bool = False,
     user: dict = Depends(get_current_user),
 ):
@@ -56,81 +173,88 @@ async def get_fitness(
     # Use granular cache key for complete fitness data
     cache_key = "fitness:complete"
 
-    # Check cache first (unless refresh is requested)
-    if not refresh:
-        cached = get_cached(user_id, cache_key)
-        if cached:
-            return cached
-
-    try:
+    async def _load():
         client = await get_user_intervals_client(user_id)
         snapshot, profile_data = await asyncio.gather(
             get_fitness_snapshot(user_id, client, refresh=refresh),
             get_cached_athlete_profile(user_id, client, refresh=refresh),
         )
 
-        training_data = TrainingMetrics(
-            ctl=snapshot.training_metrics.ctl,
-            atl=snapshot.training_metrics.atl,
-            tsb=snapshot.training_metrics.tsb,
-            form_status=snapshot.training_metrics.form_status,
+        # The snapshot was already computed and typed by DataProcessor, so
+        # skip construction validation
+        training = snapshot.training_metrics
+        training_data = TrainingMetrics.model_construct(
+            ctl=training.ctl,
+            atl=training.atl,
+            tsb=training.tsb,
+            form_status=training.form_status,
             ctl_history=[
-                TrainingHistoryPoint(**point) for point in snapshot.ctl_history
+                TrainingHistoryPoint.model_construct(**point)
+                for point in snapshot.ctl_history
             ],
         )
 
-        wellness_data = WellnessMetrics(
-            readiness=snapshot.wellness_metrics.readiness,
-            hrv=snapshot.wellness_metrics.hrv,
-            hrv_sdnn=snapshot.wellness_metrics.hrv_sdnn,
-            rhr=snapshot.wellness_metrics.rhr,
-            sleep_hours=snapshot.wellness_metrics.sleep_hours,
-            sleep_score=snapshot.wellness_metrics.sleep_score,
-            sleep_quality=snapshot.wellness_metrics.sleep_quality,
-            weight=snapshot.wellness_metrics.weight,
-            body_fat=snapshot.wellness_metrics.body_fat,
-            vo2max=snapshot.wellness_metrics.vo2max or profile_data.vo2max,
-            soreness=snapshot.wellness_metrics.soreness,
-            fatigue=snapshot.wellness_metrics.fatigue,
-            stress=snapshot.wellness_metrics.stress,
-            mood=snapshot.wellness_metrics.mood,
-            motivation=snapshot.wellness_metrics.motivation,
-            spo2=snapshot.wellness_metrics.spo2,
-            systolic=snapshot.wellness_metrics.systolic,
-            diastolic=snapshot.wellness_metrics.diastolic,
-            respiration=snapshot.wellness_metrics.respiration,
-            readiness_score=snapshot.wellness_metrics.readiness_score,
-            active_calories_load=snapshot.wellness_metrics.active_calories_load,
+        wellness = snapshot.wellness_metrics
+        wellness_data = WellnessMetrics.model_construct(
+            **{name: getattr(wellness, name) for name in _WELLNESS_COPIED_FIELDS},
+            # DataProcessor types RHR as float; the schema field is int
+            rhr=int(wellness.rhr) if wellness.rhr is not None else None,
+            vo2max=wellness.vo2max or profile_data.vo2max,
             active_calories_history=[
-                ActiveCaloriesHistoryPoint(**point)
-                for point in (snapshot.wellness_metrics.active_calories_history or [])
+                ActiveCaloriesHistoryPoint.model_construct(**point)
+                for point in (wellness.active_calories_history or [])
             ],
         )
 
-        response = FitnessResponse(
+        response = FitnessResponse.model_construct(
             training=training_data,
             wellness=wellness_data,
             profile=profile_data,
         )
 
-        # Cache the complete response
-        set_cached(user_id, cache_key, response)
-
         # Also cache individual components with their own TTLs
         set_cached(user_id, "fitness:training", training_data)
         set_cached(user_id, "fitness:wellness", wellness_data)
 
         return response
-    except UserApiServiceError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except IntervalsAPIError as e:
-        raise HTTPException(status_code=502, detail=f"Intervals.icu API error: {e}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+
+    return await _cached_json(request, user_id, cache_key, _load, refresh)
+
+
+def _parse_zones(raw, names: tuple[str, ...], zone_cls, min_key: str, max_key: str):
+    """Parse Intervals.icu zones given as {name, min, max} dicts or [min, max] pairs.
+
+    Pairs carry no name, so they are labelled from ``names`` (falling back to
+    Z<n>). Zones are validated here because sport settings bypass
+    response_model on the cached JSON path.
+    """
+    zones = []
+    for i, z in enumerate(raw or (), start=1):
+        if isinstance(z, dict):
+            zones.append(
+                zone_cls(
+                    id=i,
+                    name=z.get("name", f"Z{i}"),
+                    **{min_key: z.get("min"), max_key: z.get("max")},
+                )
+            )
+        elif isinstance(z, list) and len(z) >= 2:
+            zones.append(
+                zone_cls(
+                    id=i,
+                    name=names[i - 1] if i <= len(names) else f"Z{i}",
+                    **{
+                        min_key: int(z[0]) if z[0] else None,
+                        max_key: int(z[1]) if z[1] else None,
+                    },
+                )
+            )
+    return zones
 
 
 @router.get("/sport-settings", response_model=SportSettings)
 async def get_sport_settings(
+    request: Request,
     sport: str = "Ride",
     refresh: bool = False,
     user: dict = Depends(get_current_user),
@@ -144,22 +268,12 @@ async def get_sport_settings(
     user_id = user["id"]
     cache_key = f"sport_settings:{sport}"
 
-    # Check cache first (unless refresh is requested)
-    if not refresh:
-        cached = get_cached(user_id, cache_key)
-        if cached:
-            return cached
-
-    try:
+    async def _load():
         client = await get_user_intervals_client(user_id)
-        athlete_data = client.get_athlete_profile()
+        athlete_data = await get_cached_athlete_data(user_id, client, refresh=refresh)
 
         # Find sport settings for requested sport
-        sport_settings = athlete_data.get("sportSettings", [])
-        ride_settings = next(
-            (s for s in sport_settings if sport in s.get("types", [])),
-            sport_settings[0] if sport_settings else {},
-        )
+        ride_settings = select_sport_settings(athlete_data, sport)
 
         # Extract FTP and related
         ftp = ride_settings.get("ftp")
@@ -172,67 +286,20 @@ async def get_sport_settings(
         lthr = ride_settings.get("lthr")
         resting_hr = ride_settings.get("resting_hr")
 
-        # Extract power zones
-        power_zones_raw = ride_settings.get("power_zones", []) or []
-        power_zones = []
-        for i, z in enumerate(power_zones_raw):
-            if isinstance(z, dict):
-                power_zones.append(
-                    PowerZone(
-                        id=i + 1,
-                        name=z.get("name", f"Z{i+1}"),
-                        min_watts=z.get("min"),
-                        max_watts=z.get("max"),
-                    )
-                )
-            elif isinstance(z, list) and len(z) >= 2:
-                zone_names = [
-                    "Recovery",
-                    "Endurance",
-                    "Tempo",
-                    "Threshold",
-                    "VO2max",
-                    "Anaerobic",
-                    "Neuromuscular",
-                ]
-                power_zones.append(
-                    PowerZone(
-                        id=i + 1,
-                        name=zone_names[i] if i < len(zone_names) else f"Z{i+1}",
-                        min_watts=int(z[0]) if z[0] else None,
-                        max_watts=int(z[1]) if len(z) > 1 and z[1] else None,
-                    )
-                )
-
-        # Extract HR zones
-        hr_zones_raw = ride_settings.get("hr_zones", []) or []
-        hr_zones = []
-        for i, z in enumerate(hr_zones_raw):
-            if isinstance(z, dict):
-                hr_zones.append(
-                    HRZone(
-                        id=i + 1,
-                        name=z.get("name", f"Z{i+1}"),
-                        min_bpm=z.get("min"),
-                        max_bpm=z.get("max"),
-                    )
-                )
-            elif isinstance(z, list) and len(z) >= 2:
-                hr_zone_names = [
-                    "Recovery",
-                    "Endurance",
-                    "Tempo",
-                    "Threshold",
-                    "VO2max",
-                ]
-                hr_zones.append(
-                    HRZone(
-                        id=i + 1,
-                        name=hr_zone_names[i] if i < len(hr_zone_names) else f"Z{i+1}",
-                        min_bpm=int(z[0]) if z[0] else None,
-                        max_bpm=int(z[1]) if len(z) > 1 and z[1] else None,
-                    )
-                )
+        power_zones = _parse_zones(
+            ride_settings.get("power_zones"),
+            _POWER_ZONE_NAMES,
+            PowerZone,
+            "min_watts",
+            "max_watts",
+        )
+        hr_zones = _parse_zones(
+            ride_settings.get("hr_zones"),
+            _HR_ZONE_NAMES,
+            HRZone,
+            "min_bpm",
+            "max_bpm",
+        )
 
         # Calculate W/kg
         weight = athlete_data.get("icu_weight")
@@ -253,21 +320,44 @@ async def get_sport_settings(
             sport_types=ride_settings.get("types", []),
         )
 
-        # Cache the response
-        set_cached(user_id, cache_key, response)
-
         return response
-    except UserApiServiceError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except IntervalsAPIError as e:
-        raise HTTPException(status_code=502, detail=f"Intervals.icu API error: {e}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+
+    return await _cached_json(request, user_id, cache_key, _load, refresh)
+
+
+def _start_date_local(activity: dict) -> str:
+    return activity.get("start_date_local") or ""
+
+
+def _iter_activities(upstream: list[dict]) -> Iterator[Activity]:
+    """Yield Activity rows for upstream activities, skipping empty ones."""
+    # Fields are already shaped here, so skip the per-row construction
+    # validation; globals/attributes are bound once for the loop
+    construct = Activity.model_construct
+    fields = _ACTIVITY_FIELDS
+    for a in upstream:
+        aid, start, name, activity_type, duration, tss, distance = map(a.get, fields)
+        name = name or activity_type
+        if not name:
+            continue
+
+        yield construct(
+            id="" if aid is None else str(aid),
+            date=(start or "")[:10],
+            name=name,
+            type=activity_type or "Ride",
+            duration_minutes=int(duration) // 60 if duration else None,
+            tss=tss,
+            distance_km=round(distance / 1000, 1) if distance else None,
+        )
 
 
 @router.get("/activities", response_model=ActivitiesResponse)
 async def get_activities(
+    request: Request,
     days: int = 30,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = None,
     refresh: bool = False,
     user: dict = Depends(get_current_user),
 ):
@@ -275,61 +365,78 @@ async def get_activities(
 
     Args:
         days: Number of days to look back.
+        limit: Page size. When set, activities are returned newest first.
+        cursor: ``next_cursor`` from the previous page; only activities that
+            started before it are returned.
         refresh: If True, bypass cache and fetch fresh data.
     """
     user_id = user["id"]
     cache_key = f"{CACHE_KEYS['activities']}:{days}"
+    if limit is not None or cursor:
+        cache_key = f"{cache_key}:{limit}:{cursor or ''}"
 
-    # Check cache first (unless refresh is requested)
-    if not refresh:
-        cached = get_cached(user_id, cache_key)
-        if cached:
-            return cached
-
-    try:
+    async def _load():
         client = await get_user_intervals_client(user_id)
-        activities = client.get_recent_activities(days=days)
-
-        result = []
-        for a in activities:
-            # Skip empty activities
-            name = a.get("name") or a.get("type") or ""
-            if not name:
-                continue
-
-            duration = a.get("moving_time", 0)
-            result.append(
-                Activity(
-                    id=str(a.get("id", "")),
-                    date=str(a.get("start_date_local", ""))[:10],
-                    name=name,
-                    type=a.get("type", "Ride"),
-                    duration_minutes=duration // 60 if duration else None,
-                    tss=a.get("icu_training_load"),
-                    distance_km=(
-                        round(a.get("distance", 0) / 1000, 1)
-                        if a.get("distance")
-                        else None
-                    ),
-                )
-            )
-
-        response = ActivitiesResponse(activities=result, total=len(result))
+        activities = await _get_raw_activities(
+            user_id, client.config, days, refresh=refresh
+        )
 
-        # Cache the response
-        set_cached(user_id, cache_key, response)
+        next_cursor = None
+        if limit is not None or cursor:
+            # Page on the raw rows so only the requested slice is converted
+            activities = sorted(activities, key=_start_date_local, reverse=True)
+            if cursor:
+                activities = [a for a in activities if _start_date_local(a) < cursor]
+            if limit is not None and len(activities) > limit:
+                activities = activities[:limit]
+                next_cursor = _start_date_local(activities[-1])
+
+        result = list(_iter_activities(activities))
+        response = ActivitiesResponse.model_construct(
+            activities=result, total=len(result), next_cursor=next_cursor
+        )
 
         return response
-    except UserApiServiceError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except IntervalsAPIError as e:
-        raise HTTPException(status_code=502, detail=f"Intervals.icu API error: {e}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+
+    return await _cached_json(request, user_id, cache_key, _load, refresh)
+
+
+def _to_weekly_event(src: dict, is_actual: bool) -> WeeklyEvent:
+    """Normalize a planned Intervals.icu event or a completed activity."""
+    src_id, start, name, src_type, moving_time, tss, trainer, description = map(
+        src.get, _WEEKLY_EVENT_FIELDS
+    )
+
+    if is_actual:
+        # Intervals marks indoor sessions with a Virtual* type or the `trainer` flag
+        is_indoor = trainer is True or src_type in _VIRTUAL_TYPES
+        event_id = f"act_{src_id}"  # Prefix to distinguish
+        name = name or "Activity"
+        category = "ACTIVITY"
+        description = None  # Activities don't have descriptions in the same way
+    else:
+        is_indoor = False  # Planned doesn't usually specify indoor unless in name
+        event_id = str(src_id)
+        name = name or "Workout"
+        category = _WORKOUT
+
+    return WeeklyEvent.model_construct(
+        id=event_id,
+        date=(start or "")[:10],
+        name=name,
+        category=category,
+        workout_type=src_type,
+        duration_minutes=moving_time // 60 if moving_time else None,
+        tss=tss or 0,
+        description=description,
+        is_actual=is_actual,
+        is_indoor=is_indoor,
+    )
 
 
 @router.get("/weekly-calendar", response_model=WeeklyCalendarResponse)
 async def get_weekly_calendar(
+    request: Request,
     refresh: bool = False,
     user: dict = Depends(get_current_user),
 ):
@@ -339,132 +446,82 @@ async def get_weekly_calendar(
         refresh: If True, bypass cache and fetch fresh data.
     """
     user_id = user["id"]
-    cache_key = CACHE_KEYS["calendar"]
 
-    # Check cache first (unless refresh is requested)
-    if not refresh:
-        cached = get_cached(user_id, cache_key)
-        if cached:
-            return cached
+    # Get this week's date range (Monday to Sunday); the cache key is per week
+    # so a cached calendar is never served after Monday rolls over
+    today = date.today()
+    week_start = today - timedelta(days=today.weekday())  # Monday
+    week_end = week_start + timedelta(days=6)  # Sunday
+    cache_key = f"{CACHE_KEYS['calendar']}:{week_start.isoformat()}"
 
-    try:
+    async def _load():
         client = await get_user_intervals_client(user_id)
 
-        # Get this week's date range (Monday to Sunday)
-        today = date.today()
-        week_start = today - timedelta(days=today.weekday())  # Monday
-        week_end = week_start + timedelta(days=6)  # Sunday
-
-        # Fetch events (Planned) AND activities (Actual)
-        events_data = client.get_events(oldest=week_start, newest=week_end)
-        activities_data = client.get_recent_activities(
-            days=60
-        )  # Fetch ample history then filter
+        # Fetch events (Planned) AND activities (Actual) concurrently; this
+        # week's activities come from the shared raw activities cache
+        events_data, activities_data = await asyncio.gather(
+            run_intervals(
+                user_id,
+                client.config,
+                lambda c: c.get_events(
+                    oldest=week_start, newest=week_end, category=_WORKOUT
+                ),
+            ),
+            _get_raw_activities(
+                user_id, client.config, (today - week_start).days, refresh=refresh
+            ),
+        )
 
-        # Filter activities for this week
-        week_activities = []
-        for a in activities_data:
-            a_date = a.get("start_date_local", "")[:10]
-            if week_start.isoformat() <= a_date <= week_end.isoformat():
-                week_activities.append(a)
+        # Filter activities for this week (bounds formatted once, not per item)
+        week_start_iso = week_start.isoformat()
+        week_end_iso = week_end.isoformat()
+        week_activities = [
+            a
+            for a in activities_data
+            if week_start_iso <= (a.get("start_date_local") or "")[:10] <= week_end_iso
+        ]
 
+        # One pass over the planned events builds everything derived from them
+        planned_events = []
+        valid_event_ids = []
         combined_events = []
         planned_tss = 0
-        actual_tss = 0
-
-        # Process Planned Events
         for e in events_data:
-            category = e.get("category", "")
-            if category != "WORKOUT":
+            # Intervals.icu already filtered by category; this only guards
+            # against the filter being ignored upstream
+            if e.get("category") != _WORKOUT:
                 continue
+            event = _to_weekly_event(e, False)
+            planned_events.append(e)
+            valid_event_ids.append(e.get("id"))
+            combined_events.append(event)
+            # "Planned TSS" includes everything on the plan, completed or not
+            planned_tss += event.tss
 
-            tss = e.get("icu_training_load") or 0
-            # Only add to planned TSS if not completed?
-            # Or just sum all planned. Usually "Planned TSS" includes everything on the plan.
-            planned_tss += tss
-
-            # Parse date
-            start_date = e.get("start_date_local", "")[:10]
-
-            # Get duration
-            moving_time = e.get("moving_time")
-            duration_minutes = moving_time // 60 if moving_time else None
-
-            combined_events.append(
-                WeeklyEvent(
-                    id=str(e.get("id")),
-                    date=start_date,
-                    name=e.get("name", "Workout"),
-                    category="WORKOUT",
-                    workout_type=e.get("type"),
-                    duration_minutes=duration_minutes,
-                    tss=tss,
-                    description=e.get("description"),
-                    is_actual=False,
-                    is_indoor=False,  # Planned doesn't usually specify indoor unless in name
-                )
-            )
-
-            # Sync to local DB (only planned workouts that might have definitions)
-            from ..services.user_api_service import sync_workout_from_intervals
-
-            # Await sync to ensure data is available for detailed view
-            await sync_workout_from_intervals(user_id, e)
+        # Sync planned workouts to local DB in one batch (awaited so data is
+        # available for the detailed view)
+        await sync_workouts_from_intervals(user_id, planned_events)
 
         # Cleanup stale workouts that no longer exist in Intervals.icu
-        from ..services.user_api_service import cleanup_stale_workouts
-
-        valid_event_ids = [
-            e.get("id") for e in events_data if e.get("category") == "WORKOUT"
-        ]
         await cleanup_stale_workouts(
             user_id,
-            week_start.isoformat(),
-            week_end.isoformat(),
+            week_start_iso,
+            week_end_iso,
             valid_event_ids,
         )
 
-        # Process Actual Activities
-        for a in week_activities:
-            tss = a.get("icu_training_load") or 0
-            actual_tss += tss
-
-            start_date = a.get("start_date_local", "")[:10]
-            moving_time = a.get("moving_time")
-            duration_minutes = moving_time // 60 if moving_time else None
-
-            # Check if indoor
-            # Intervals often puts " VirtualRide" or similar in type, or `trainer` flag
-            is_indoor = a.get("trainer") is True or "Virtual" in a.get("type", "")
-
-            combined_events.append(
-                WeeklyEvent(
-                    id=f"act_{a.get('id')}",  # Prefix to distinguish
-                    date=start_date,
-                    name=a.get("name", "Activity"),
-                    category="ACTIVITY",
-                    workout_type=a.get("type"),
-                    duration_minutes=duration_minutes,
-                    tss=tss,
-                    description=None,  # Activities don't have descriptions in the same way
-                    is_actual=True,
-                    is_indoor=is_indoor,
-                )
-            )
+        actual_events = [_to_weekly_event(a, True) for a in week_activities]
+        combined_events += actual_events
+        actual_tss = sum(event.tss for event in actual_events)
 
-        response = WeeklyCalendarResponse(
-            week_start=week_start.isoformat(),
-            week_end=week_end.isoformat(),
+        response = WeeklyCalendarResponse.model_construct(
+            week_start=week_start_iso,
+            week_end=week_end_iso,
             events=combined_events,
             planned_tss=int(planned_tss),
             actual_tss=int(actual_tss),
         )
 
-        # Cache the response
-        set_cached(user_id, cache_key, response)
-
         return response
-    except UserApiServiceError as e:
-        raise HTTPException(status_code=502, detail=f"Intervals.icu API error: {e}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+
+    return await _cached_json(request, user_id, cache_key, _load, refresh)
@@ -3,23 +3,23 @@
 Endpoints for managing weekly workout plans and daily workouts.
 """
 
-import os
-import sys
+import asyncio
+import copy
 import json
 import logging
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Optional, List
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
-sys.path.insert(
-    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
-
 from .auth import get_current_user
 from api.services.power_converter import convert_power_to_watts
+from ..services.blocking import run
 from ..services.cache_service import clear_user_cache
 from ..services.recommendation_history_service import get_recent_profile_ids
+from src.services.workout_modules import ALL_MODULES, get_module_category
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -154,8 +154,8 @@ async def get_completed_tss_for_week(
 
     try:
         intervals_client = await get_user_intervals_client(user_id)
-        activities = intervals_client.get_activities(
-            oldest=week_start, newest=yesterday
+        activities = await run(
+            intervals_client.get_activities, oldest=week_start, newest=yesterday
         )
         total_tss = sum(
             a.get("icu_training_load") or 0
@@ -172,6 +172,32 @@ async def get_completed_tss_for_week(
         return 0
 
 
+_DAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
+# Fallback mapping for common LLM-invented module names
+_FALLBACK_MODULES = {
+    "progressive_warmup_20min": "progressive_warmup_15min",
+    "progressive_warmup_10min": "stepped_warmup_10min",
+    "standard_warmup": "ramp_standard",
+    "basic_cooldown": "flush_and_fade",
+    "easy_cooldown": "flush_and_fade",
+}
+
+# Substrings recognising unknown block types in _smart_fallback_for_unknown_block
+_WARMUP_KEYWORDS = ("warmup", "warm_up", "warm-up", "ramp_up")
+_COOLDOWN_KEYWORDS = ("cooldown", "cool_down", "cool-down", "ramp_down")
+_INTERVAL_KEYWORDS = ("interval", "repeat", "set")
+_REST_KEYWORDS = ("rest", "recovery", "easy")
+
+
 def _smart_fallback_for_unknown_block(block_type: str, block: dict) -> Optional[dict]:
     """Smart fallback for unknown block types based on naming patterns.
 
@@ -186,9 +212,7 @@ def _smart_fallback_for_unknown_block(block_type: str, block: dict) -> Optional[
     type_lower = block_type.lower()
 
     # Warmup patterns
-    if any(
-        keyword in type_lower for keyword in ["warmup", "warm_up", "warm-up", "ramp_up"]
-    ):
+    if any(keyword in type_lower for keyword in _WARMUP_KEYWORDS):
         return {
             "duration": block.get("duration_minutes", 10) * 60,
             "power": {
@@ -201,10 +225,7 @@ def _smart_fallback_for_unknown_block(block_type: str, block: dict) -> Optional[
         }
 
     # Cooldown patterns
-    if any(
-        keyword in type_lower
-        for keyword in ["cooldown", "cool_down", "cool-down", "ramp_down"]
-    ):
+    if any(keyword in type_lower for keyword in _COOLDOWN_KEYWORDS):
         return {
             "duration": block.get("duration_minutes", 10) * 60,
             "power": {
@@ -217,7 +238,7 @@ def _smart_fallback_for_unknown_block(block_type: str, block: dict) -> Optional[
         }
 
     # Interval patterns
-    if any(keyword in type_lower for keyword in ["interval", "repeat", "set"]):
+    if any(keyword in type_lower for keyword in _INTERVAL_KEYWORDS):
         # Try to extract work/rest pattern
         work_power = block.get("work_power") or block.get("power", 95)
         rest_power = block.get("rest_power", 50)
@@ -246,7 +267,7 @@ def _smart_fallback_for_unknown_block(block_type: str, block: dict) -> Optional[
         }
 
     # Rest patterns
-    if any(keyword in type_lower for keyword in ["rest", "recovery", "easy"]):
+    if any(keyword in type_lower for keyword in _REST_KEYWORDS):
         return {
             "duration": block.get("duration_minutes", 1) * 60,
             "power": {"value": block.get("power", 50), "units": "%ftp"},
@@ -312,6 +333,93 @@ def resolve_workout_steps(workout: dict, ftp: int) -> Optional[List[dict]]:
     return None
 
 
+def _build_warmup_ramp(block: dict) -> dict:
+    # Ramp from start_power to end_power
+    return {
+        "duration": block["duration_minutes"] * 60,
+        "power": {
+            "start": block["start_power"],
+            "end": block["end_power"],
+            "units": "%ftp",
+        },
+        "ramp": True,
+        "warmup": True,
+    }
+
+
+def _build_cooldown_ramp(block: dict) -> dict:
+    return {
+        "duration": block["duration_minutes"] * 60,
+        "power": {
+            "start": block["start_power"],
+            "end": block["end_power"],
+            "units": "%ftp",
+        },
+        "ramp": True,
+        "cooldown": True,
+    }
+
+
+def _build_steady(block: dict) -> dict:
+    return {
+        "duration": block["duration_minutes"] * 60,
+        "power": {"value": block["power"], "units": "%ftp"},
+    }
+
+
+def _build_main_set_classic(block: dict) -> dict:
+    # Interval block: single work + rest pair, repetitions handled by repeat key
+    # Frontend stepsToChartData() and ZWO converter both use repeat to loop
+    work_step = {
+        "duration": block["work_duration_seconds"],
+        "power": {"value": block["work_power"], "units": "%ftp"},
+    }
+    rest_step = {
+        "duration": block["rest_duration_seconds"],
+        "power": {"value": block["rest_power"], "units": "%ftp"},
+    }
+    return {
+        "duration": 0,  # Duration handled by nested steps
+        "repeat": block["repetitions"],
+        "steps": [work_step, rest_step],  # Single pair, not expanded
+    }
+
+
+def _build_rest(block: dict) -> dict:
+    return {
+        "duration": block.get("duration_minutes", 1) * 60,
+        "power": {"value": block.get("power", 50), "units": "%ftp"},
+    }
+
+
+def _build_over_under(block: dict) -> dict:
+    # Over/Under intervals: single over + under pair, repetitions handled by repeat key
+    over_step = {
+        "duration": block.get("over_duration_seconds", 120),
+        "power": {"value": block.get("over_power", 105), "units": "%ftp"},
+    }
+    under_step = {
+        "duration": block.get("under_duration_seconds", 120),
+        "power": {"value": block.get("under_power", 95), "units": "%ftp"},
+    }
+    return {
+        "duration": 0,  # Duration handled by nested steps
+        "repeat": block.get("repetitions", 1),
+        "steps": [over_step, under_step],  # Single pair, not expanded
+    }
+
+
+# Module structure block type -> WorkoutStep builder
+_BLOCK_BUILDERS = {
+    "warmup_ramp": _build_warmup_ramp,
+    "cooldown_ramp": _build_cooldown_ramp,
+    "steady": _build_steady,
+    "main_set_classic": _build_main_set_classic,
+    "rest": _build_rest,
+    "over_under": _build_over_under,
+}
+
+
 def convert_structure_to_steps(module_keys: List[str], ftp: int) -> List[dict]:
     """Convert workout module keys to WorkoutStep[] format for frontend chart rendering.
 
@@ -322,25 +430,16 @@ def convert_structure_to_steps(module_keys: List[str], ftp: int) -> List[dict]:
     Returns:
         List of workout step dictionaries compatible with frontend WorkoutStep type
     """
-    from src.services.workout_modules import (
-        ALL_MODULES,
-        get_module_category,
-    )
+    # Steps are in %FTP, so the result depends only on the module keys; copy
+    # so callers can't mutate the cached steps
+    return copy.deepcopy(_convert_structure_cached(tuple(module_keys)))
 
-    # Use the combined module dictionary
-    all_modules = ALL_MODULES
 
+@lru_cache(maxsize=1024)
+def _convert_structure_cached(module_keys: tuple) -> List[dict]:
+    module_keys = list(module_keys)
     steps = []
 
-    # Fallback mapping for common LLM-invented module names
-    fallback_modules = {
-        "progressive_warmup_20min": "progressive_warmup_15min",
-        "progressive_warmup_10min": "stepped_warmup_10min",
-        "standard_warmup": "ramp_standard",
-        "basic_cooldown": "flush_and_fade",
-        "easy_cooldown": "flush_and_fade",
-    }
-
     # CRITICAL: Validate warmup/cooldown order before processing
     # Warmup modules must come first, cooldown modules must come last
     logger.info(f"🔍 Validating module order for: {module_keys}")
@@ -396,12 +495,12 @@ def convert_structure_to_steps(module_keys: List[str], ftp: int) -> List[dict]:
     logger.info(f"✅ Final validated order: {module_keys}")
 
     for module_key in module_keys:
-        module = all_modules.get(module_key)
+        module = ALL_MODULES.get(module_key)
         if not module:
             # Try fallback mapping
-            fallback_key = fallback_modules.get(module_key)
+            fallback_key = _FALLBACK_MODULES.get(module_key)
             if fallback_key:
-                module = all_modules.get(fallback_key)
+                module = ALL_MODULES.get(fallback_key)
                 logger.info(
                     f"Module not found: {module_key}, using fallback: {fallback_key}"
                 )
@@ -415,99 +514,9 @@ def convert_structure_to_steps(module_keys: List[str], ftp: int) -> List[dict]:
         for block in module.get("structure", []):
             block_type = block.get("type")
 
-            if block_type == "warmup_ramp":
-                # Ramp from start_power to end_power
-                steps.append(
-                    {
-                        "duration": block["duration_minutes"] * 60,
-                        "power": {
-                            "start": block["start_power"],
-                            "end": block["end_power"],
-                            "units": "%ftp",
-                        },
-                        "ramp": True,
-                        "warmup": True,
-                    }
-                )
-
-            elif block_type == "cooldown_ramp":
-                # Cooldown ramp
-                steps.append(
-                    {
-                        "duration": block["duration_minutes"] * 60,
-                        "power": {
-                            "start": block["start_power"],
-                            "end": block["end_power"],
-                            "units": "%ftp",
-                        },
-                        "ramp": True,
-                        "cooldown": True,
-                    }
-                )
-
-            elif block_type == "steady":
-                # Steady state power
-                steps.append(
-                    {
-                        "duration": block["duration_minutes"] * 60,
-                        "power": {"value": block["power"], "units": "%ftp"},
-                    }
-                )
-
-            elif block_type == "main_set_classic":
-                # Interval block: single work + rest pair, repetitions handled by repeat key
-                # Frontend stepsToChartData() and ZWO converter both use repeat to loop
-                work_step = {
-                    "duration": block["work_duration_seconds"],
-                    "power": {"value": block["work_power"], "units": "%ftp"},
-                }
-                rest_step = {
-                    "duration": block["rest_duration_seconds"],
-                    "power": {"value": block["rest_power"], "units": "%ftp"},
-                }
-
-                steps.append(
-                    {
-                        "duration": 0,  # Duration handled by nested steps
-                        "repeat": block["repetitions"],
-                        "steps": [work_step, rest_step],  # Single pair, not expanded
-                    }
-                )
-
-            elif block_type == "rest":
-                # Simple rest block
-                steps.append(
-                    {
-                        "duration": block.get("duration_minutes", 1) * 60,
-                        "power": {"value": block.get("power", 50), "units": "%ftp"},
-                    }
-                )
-
-            elif block_type == "over_under":
-                # Over/Under intervals: single over + under pair, repetitions handled by repeat key
-                over_step = {
-                    "duration": block.get("over_duration_seconds", 120),
-                    "power": {
-                        "value": block.get("over_power", 105),
-                        "units": "%ftp",
-                    },
-                }
-                under_step = {
-                    "duration": block.get("under_duration_seconds", 120),
-                    "power": {
-                        "value": block.get("under_power", 95),
-                        "units": "%ftp",
-                    },
-                }
-
-                steps.append(
-                    {
-                        "duration": 0,  # Duration handled by nested steps
-                        "repeat": block.get("repetitions", 1),
-                        "steps": [over_step, under_step],  # Single pair, not expanded
-                    }
-                )
-
+            builder = _BLOCK_BUILDERS.get(block_type)
+            if builder:
+                steps.append(builder(block))
             else:
                 # Unknown block type - try smart fallback based on type name
                 logger.warning(
@@ -556,39 +565,35 @@ async def get_current_weekly_plan(
 
     plan = plan_result.data
 
-    # Get daily workouts for this plan
-    workouts_result = (
-        supabase.table("daily_workouts")
-        .select("*")
-        .eq("plan_id", plan["id"])
-        .order("workout_date")
-        .execute()
-    )
-
-    day_names = [
-        "Monday",
-        "Tuesday",
-        "Wednesday",
-        "Thursday",
-        "Friday",
-        "Saturday",
-        "Sunday",
-    ]
-    daily_workouts = []
-
     # Get user profile for FTP (needed for power calculations)
     from api.services.user_api_service import get_user_profile
 
-    try:
-        user_profile = await get_user_profile(user["id"])
-        ftp = user_profile.ftp
-    except Exception as e:
-        logger.error(f"Failed to get user profile: {e}")
-        ftp = 200  # Default FTP if profile fetch fails
+    async def _get_ftp() -> int:
+        try:
+            user_profile = await get_user_profile(user["id"])
+            return user_profile.ftp
+        except Exception as e:
+            logger.error(f"Failed to get user profile: {e}")
+            return 200  # Default FTP if profile fetch fails
+
+    # Get daily workouts for this plan alongside the profile
+    workouts_result, ftp = await asyncio.gather(
+        asyncio.to_thread(
+            supabase.table("daily_workouts")
+            .select("*")
+            .eq("plan_id", plan["id"])
+            .order("workout_date")
+            .execute
+        ),
+        _get_ftp(),
+    )
+
+    daily_workouts = []
 
     for workout in workouts_result.data:
-        workout_date = datetime.strptime(workout["workout_date"], "%Y-%m-%d").date()
-        day_index = (workout_date - week_start).days
+        # DB date columns are always YYYY-MM-DD; fromisoformat is much
+        # cheaper than strptime
+        workout_date = date.fromisoformat(workout["workout_date"])
 
         # Convert to planned_steps for chart rendering
         # Priority: profile_id (new) > planned_modules (legacy)
@@ -619,11 +624,16 @@ async def get_current_weekly_plan(
                 )
                 # Gracefully handle errors - workout will show without chart
 
+        # Rows come from typed daily_workouts columns, so skip validation
         daily_workouts.append(
-            DailyWorkoutResponse(
+            DailyWorkoutResponse.model_construct(
                 id=workout["id"],
                 workout_date=workout["workout_date"],
-                day_name=day_names[day_index] if 0 <= day_index < 7 else "Unknown",
+                day_name=(
+                    _DAY_NAMES[workout_date.weekday()]
+                    if week_start <= workout_date <= week_end
+                    else "Unknown"
+                ),
                 planned_name=workout.get("planned_name"),
                 planned_type=workout.get("planned_type"),
                 planned_duration=workout.get("planned_duration"),
@@ -652,7 +662,7 @@ async def get_current_weekly_plan(
             if w.get("status") == "completed"
         )
     if not achievement_status and weekly_tss_target and weekly_tss_target > 0:
-        plan_week_end = datetime.strptime(plan["week_end"], "%Y-%m-%d").date()
+        plan_week_end = date.fromisoformat(plan["week_end"])
         if date.today() > plan_week_end:
             achievement_status, achievement_pct = calculate_achievement_status(weekly_tss_target, total_actual_tss)
         else:
@@ -661,7 +671,7 @@ async def get_current_weekly_plan(
     elif weekly_tss_target and weekly_tss_target > 0:
         achievement_pct = int((total_actual_tss / weekly_tss_target) * 100) if total_actual_tss else 0
 
-    return WeeklyPlanResponse(
+    response = WeeklyPlanResponse.model_construct(
         id=plan["id"],
         week_start=plan["week_start"],
         week_end=plan["week_end"],
@@ -674,6 +684,9 @@ async def get_current_weekly_plan(
         achievement_pct=achievement_pct,
         daily_workouts=daily_workouts,
     )
+    # Dump once and hand the dict straight to orjson; returning a Response
+    # skips FastAPI's second response_model validation + jsonable_encoder pass
+    return ORJSONResponse(response.model_dump(mode="json"))
 
 
 @router.post("/plans/weekly/generate", response_model=WeeklyPlanResponse)
@@ -721,7 +734,7 @@ async def generate_weekly_plan(
 
         intervals_client = await get_user_intervals_client(user["id"])
         processor = DataProcessor()
-        activities = intervals_client.get_recent_activities(days=42)
+        activities = await run(intervals_client.get_recent_activities, days=42)
         training = processor.calculate_training_metrics(activities)
 
         ctl = training.ctl
@@ -739,24 +752,10 @@ async def generate_weekly_plan(
 
     llm_client = get_server_llm_client()
 
-    # Resolve weekly_tss_target: request param > user_settings > settings table
+    # Resolve weekly_tss_target: request param > user_settings (select("*")
+    # above already returned the column when it exists)
     weekly_tss_target = request.weekly_tss_target or user_settings.get("weekly_tss_target")
-    
-    # If still None, try fetching from settings explicitly (column may be missing from select)
-    if weekly_tss_target is None:
-        try:
-            settings_check = (
-                supabase.table("user_settings")
-                .select("weekly_tss_target")
-                .eq("user_id", user["id"])
-                .maybe_single()
-                .execute()
-            )
-            if settings_check and settings_check.data:
-                weekly_tss_target = settings_check.data.get("weekly_tss_target")
-        except Exception:
-            pass  # Column may not exist yet
-    
+
     logger.info(f"Resolved weekly_tss_target={weekly_tss_target} for user {user['id'][:8]}...")
 
     # Detect current-week generation
@@ -822,27 +821,12 @@ async def generate_weekly_plan(
         "week_start", week_start.isoformat()
     ).execute()
 
-    # Delete existing daily_workouts for this week's date range
+    # Delete existing daily_workouts for this week's date range in one call
     # Preserve already-registered workouts (status == 'registered')
-    for i in range(7):
-        workout_date = (week_start + timedelta(days=i)).isoformat()
-        existing_result = (
-            supabase.table("daily_workouts")
-            .select("id, status")
-            .eq("user_id", user["id"])
-            .eq("workout_date", workout_date)
-            .execute()
-        )
-        if existing_result and existing_result.data:
-            for row in existing_result.data:
-                if row.get("status") == "registered":
-                    logger.info(
-                        f"Preserving registered workout {row['id']} on {workout_date}"
-                    )
-                    continue
-                supabase.table("daily_workouts").delete().eq(
-                    "id", row["id"]
-                ).execute()
+    week_dates = [(week_start + timedelta(days=i)).isoformat() for i in range(7)]
+    supabase.table("daily_workouts").delete().eq("user_id", user["id"]).in_(
+        "workout_date", week_dates
+    ).or_("status.is.null,status.neq.registered").execute()
 
     # Save weekly plan to DB
     plan_insert_data = {
@@ -865,23 +849,24 @@ async def generate_weekly_plan(
 
     # Collect dates that still have registered workouts (skip inserting for those)
     registered_dates: set = set()
-    for i in range(7):
-        workout_date = (week_start + timedelta(days=i)).isoformat()
-        reg_check = (
-            supabase.table("daily_workouts")
-            .select("id")
-            .eq("user_id", user["id"])
-            .eq("workout_date", workout_date)
-            .eq("status", "registered")
-            .execute()
-        )
-        if reg_check and reg_check.data:
-            registered_dates.add(workout_date)
-            # Link preserved registered workouts to the new plan
-            for row in reg_check.data:
-                supabase.table("daily_workouts").update(
-                    {"plan_id": plan_id}
-                ).eq("id", row["id"]).execute()
+    reg_check = (
+        supabase.table("daily_workouts")
+        .select("id, workout_date")
+        .eq("user_id", user["id"])
+        .in_("workout_date", week_dates)
+        .eq("status", "registered")
+        .execute()
+    )
+    if reg_check and reg_check.data:
+        for row in reg_check.data:
+            logger.info(
+                f"Preserving registered workout {row['id']} on {row['workout_date']}"
+            )
+            registered_dates.add(row["workout_date"])
+        # Link preserved registered workouts to the new plan
+        supabase.table("daily_workouts").update({"plan_id": plan_id}).in_(
+            "id", [row["id"] for row in reg_check.data]
+        ).execute()
 
     # Save daily workouts (skip dates with registered workouts)
     daily_workouts_data = []
@@ -939,29 +924,50 @@ async def get_today_workout(user: dict = Depends(get_current_user)):
     """Get today's planned workout."""
     supabase = _get_supabase_admin_client()
     today = date.today()
+    week_start, week_end = get_week_dates(today)
 
-    # Get today's workout
-    workout_result = (
-        supabase.table("daily_workouts")
-        .select("*")
-        .eq("user_id", user["id"])
-        .eq("workout_date", today.isoformat())
-        .maybe_single()
-        .execute()
+    # The four reads are independent, so run them concurrently: today's
+    # workout, this week's workouts, and both TSS target sources
+    (
+        workout_result,
+        week_workouts_result,
+        settings_result,
+        weekly_plan_result,
+    ) = await asyncio.gather(
+        asyncio.to_thread(
+            supabase.table("daily_workouts")
+            .select("*")
+            .eq("user_id", user["id"])
+            .eq("workout_date", today.isoformat())
+            .maybe_single()
+            .execute
+        ),
+        asyncio.to_thread(
+            supabase.table("daily_workouts")
+            .select("*")
+            .eq("user_id", user["id"])
+            .gte("workout_date", week_start.isoformat())
+            .lte("workout_date", week_end.isoformat())
+            .execute
+        ),
+        asyncio.to_thread(
+            supabase.table("user_settings")
+            .select("weekly_tss_target")
+            .eq("user_id", user["id"])
+            .maybe_single()
+            .execute
+        ),
+        asyncio.to_thread(
+            supabase.table("weekly_plans")
+            .select("weekly_tss_target")
+            .eq("user_id", user["id"])
+            .eq("week_start", week_start.isoformat())
+            .maybe_single()
+            .execute
+        ),
     )
 
     # --- Weekly TSS tracking ---
-    week_start, week_end = get_week_dates(today)
-
-    # Get all workouts for this week
-    week_workouts_result = (
-        supabase.table("daily_workouts")
-        .select("*")
-        .eq("user_id", user["id"])
-        .gte("workout_date", week_start.isoformat())
-        .lte("workout_date", week_end.isoformat())
-        .execute()
-    )
     week_workouts = week_workouts_result.data if week_workouts_result and week_workouts_result.data else []
 
     # Accumulated TSS (completed workouts only)
@@ -973,26 +979,11 @@ async def get_today_workout(user: dict = Depends(get_current_user)):
 
     # Get TSS target: prefer user_settings (most up-to-date), fall back to weekly_plans
     weekly_tss_target = None
-    settings_result = (
-        supabase.table("user_settings")
-        .select("weekly_tss_target")
-        .eq("user_id", user["id"])
-        .maybe_single()
-        .execute()
-    )
     if settings_result and settings_result.data:
         weekly_tss_target = settings_result.data.get("weekly_tss_target")
 
     # Fallback to weekly_plans.weekly_tss_target if user_settings has no target
     if not weekly_tss_target:
-        weekly_plan_result = (
-            supabase.table("weekly_plans")
-            .select("weekly_tss_target")
-            .eq("user_id", user["id"])
-            .eq("week_start", week_start.isoformat())
-            .maybe_single()
-            .execute()
-        )
         if weekly_plan_result and weekly_plan_result.data:
             weekly_tss_target = weekly_plan_result.data.get("weekly_tss_target")
 
@@ -1019,7 +1010,7 @@ async def get_today_workout(user: dict = Depends(get_current_user)):
         })
 
     if not workout_result or not workout_result.data:
-        return TodayWorkoutResponse(
+        response = TodayWorkoutResponse(
             has_plan=False,
             workout=None,
             can_regenerate=True,
@@ -1030,18 +1021,10 @@ async def get_today_workout(user: dict = Depends(get_current_user)):
             target_achievable=target_achievable,
             achievement_warning=achievement_warning,
         )
+        return ORJSONResponse(response.model_dump(mode="json"))
 
     workout = workout_result.data
-    day_names = [
-        "Monday",
-        "Tuesday",
-        "Wednesday",
-        "Thursday",
-        "Friday",
-        "Saturday",
-        "Sunday",
-    ]
-    day_name = day_names[today.weekday()]
+    day_name = _DAY_NAMES[today.weekday()]
 
     # Get wellness hint (if available)
     wellness_hint = None
@@ -1051,7 +1034,7 @@ async def get_today_workout(user: dict = Depends(get_current_user)):
 
         intervals_client = await get_user_intervals_client(user["id"])
         processor = DataProcessor()
-        activities = intervals_client.get_recent_activities(days=42)
+        activities = await run(intervals_client.get_recent_activities, days=42)
         training = processor.calculate_training_metrics(activities)
 
         tsb = training.tsb
@@ -1061,7 +1044,7 @@ async def get_today_workout(user: dict = Depends(get_current_user)):
     except Exception:
         pass
 
-    return TodayWorkoutResponse(
+    response = TodayWorkoutResponse(
         has_plan=True,
         workout=DailyWorkoutResponse(
             id=workout["id"],
@@ -1088,6 +1071,8 @@ async def get_today_workout(user: dict = Depends(get_current_user)):
         target_achievable=target_achievable,
         achievement_warning=achievement_warning,
     )
+    # Returned as a Response so FastAPI doesn't revalidate the model
+    return ORJSONResponse(response.model_dump(mode="json"))
 
 
 @router.post("/plans/today/regenerate")
@@ -1143,7 +1128,7 @@ async def regenerate_today_workout(
 
         intervals_client = await get_user_intervals_client(user["id"])
         processor = DataProcessor()
-        activities = intervals_client.get_recent_activities(days=42)
+        activities = await run(intervals_client.get_recent_activities, days=42)
         training = processor.calculate_training_metrics(activities)
 
         ctl = training.ctl
@@ -1389,16 +1374,17 @@ async def register_weekly_plan_to_intervals(
             moving_time = total_duration_minutes * 60  # Convert to seconds
 
             # Check if a workout already exists for this date and delete it
-            existing_workout = intervals.check_workout_exists(workout_date)
+            existing_workout = await run(intervals.check_workout_exists, workout_date)
             if existing_workout:
                 existing_id = existing_workout.get("id")
                 logger.info(
                     f"Found existing workout on {workout_date} (event_id: {existing_id}), deleting before registration"
                 )
-                intervals.delete_event(existing_id)
+                await run(intervals.delete_event, existing_id)
 
             # Register to Intervals.icu
-            result = intervals.create_workout(
+            result = await run(
+                intervals.create_workout,
                 target_date=workout_date,
                 name=workout_name,
                 description=workout_description,
@@ -1543,7 +1529,7 @@ async def sync_weekly_plan_with_intervals(
 
     # Fetch events from Intervals.icu for the week
     try:
-        events = intervals.get_events(oldest=week_start, newest=week_end)
+        events = await run(intervals.get_events, oldest=week_start, newest=week_end)
     except Exception as e:
         logger.error(f"Failed to fetch events from Intervals.icu: {e}")
         raise HTTPException(
@@ -1580,7 +1566,7 @@ async def sync_weekly_plan_with_intervals(
         else:
             # Check if moved or modified
             event = events_by_id[event_id]
-            event_date = event.get("start_date_local", "")[:10]  # Extract YYYY-MM-DD
+            event_date = (event.get("start_date_local") or "")[:10]  # Extract YYYY-MM-DD
             event_name = event.get("name", "")
 
             if event_date != workout_date:
@@ -1681,7 +1667,7 @@ def _calculate_actual_tss_for_plan(supabase, plan_id: str, user_id: str) -> int:
 def _is_plan_finalized(plan_data: dict, week_end_str: str) -> bool:
     """Check if a plan should be considered finalized (week has passed)."""
     try:
-        week_end = datetime.strptime(week_end_str, "%Y-%m-%d").date()
+        week_end = date.fromisoformat(week_end_str)
         return date.today() > week_end
     except (ValueError, TypeError):
         return False
@@ -1,17 +1,10 @@
 """User settings router."""
 
-import os
 import logging
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from typing import Optional, Dict, List
 
-import sys
-
-sys.path.insert(
-    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
-
 from src.clients.supabase_client import get_supabase_client, get_supabase_admin_client
 from .auth import get_current_user
 from api.constants import DEFAULT_WEEKLY_AVAILABILITY
@@ -13,11 +13,8 @@ from ..schemas import (
     WorkoutCreateResponse,
 )
 
-import sys
-
-sys.path.insert(0, str(__file__).replace("/api/routers/workout.py", ""))
-
 from src.clients.intervals import IntervalsAPIError
+from src.clients.supabase_client import get_supabase_admin_client
 from src.services.workout_generator import WorkoutGenerator
 from src.services.fatigue_detector import compute_baseline, detect_acute_fatigue
 from .auth import get_current_user
@@ -26,11 +23,13 @@ from ..services.user_api_service import (
     get_server_llm_client,
     get_user_profile,
     get_data_processor,
+    get_todays_workout,
     check_rate_limit,
     increment_usage,
     UserApiServiceError,
     RateLimitExceededError,
 )
+from ..services.blocking import run
 from ..services.cache_service import clear_user_cache
 from ..services.audit_service import log_audit_event, AuditEventType
 from ..services.fitness_snapshot_service import get_fitness_snapshot
@@ -56,7 +55,6 @@ async def generate_workout(
         llm = get_server_llm_client()
         user_profile = await get_user_profile(user["id"])
         processor = get_data_processor()
-        from src.clients.supabase_client import get_supabase_admin_client
         supabase = get_supabase_admin_client()
 
         # Parse target date
@@ -110,24 +108,19 @@ async def generate_workout(
         except Exception as e:
             logger.warning(f"Fatigue detection failed (non-fatal): {e}")
 
-        # Calculate Weekly TSS (Mon -> Today) and Yesterday's Load
-        weekly_tss = sum(
-            activity.get("training_load", 0) or 0
-            for activity in activities
-            if activity.get("start_date_local", "").startswith(
-                str(start_of_week.year)
-            )  # Simple year check first for speed
-            and start_of_week.strftime("%Y-%m-%d")
-            <= activity.get("start_date_local", "")[:10]
-            <= today.strftime("%Y-%m-%d")
-        )
-
-        yesterday_load = sum(
-            activity.get("training_load", 0) or 0
-            for activity in activities
-            if activity.get("start_date_local", "")[:10]
-            == yesterday.strftime("%Y-%m-%d")
-        )
+        # Calculate Weekly TSS (Mon -> Today) and Yesterday's Load in one pass
+        week_start_iso = start_of_week.isoformat()
+        today_iso = today.isoformat()
+        yesterday_iso = yesterday.isoformat()
+        weekly_tss = 0
+        yesterday_load = 0
+        for activity in activities:
+            day = (activity.get("start_date_local") or "")[:10]
+            load = activity.get("training_load", 0) or 0
+            if week_start_iso <= day <= today_iso:
+                weekly_tss += load
+            if day == yesterday_iso:
+                yesterday_load += load
 
         training_metrics = snapshot.training_metrics
         wellness_metrics = snapshot.wellness_metrics
@@ -222,7 +215,7 @@ async def create_workout(
         target_date = date.fromisoformat(request.target_date)
 
         # Check for existing workout
-        existing = intervals.check_workout_exists(target_date)
+        existing = await run(intervals.check_workout_exists, target_date)
 
         if existing and not request.force:
             return WorkoutCreateResponse(
@@ -232,10 +225,11 @@ async def create_workout(
 
         # Delete existing if force
         if existing and request.force:
-            intervals.delete_event(existing["id"])
+            await run(intervals.delete_event, existing["id"])
 
         # Create new workout
-        event = intervals.create_workout(
+        event = await run(
+            intervals.create_workout,
             name=request.name,
             description=request.workout_text,
             target_date=target_date,
@@ -280,8 +274,6 @@ async def create_workout(
 async def get_today_workout(date: str = None, user: dict = Depends(get_current_user)):
     """Get the saved workout for today or specific date."""
     try:
-        from ..services.user_api_service import get_todays_workout
-
         workout = await get_todays_workout(user["id"], target_date=date)
 
         if workout:
@@ -262,6 +262,9 @@ class ActivitiesResponse(BaseModel):
 
     activities: List[Activity]
     total: int
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (when paginated with limit)"
+    )
 
 
 # --- Weekly Calendar ---
@@ -0,0 +1,78 @@
+"""Bounded thread pool for blocking upstream calls.
+
+IntervalsClient is synchronous (requests-based), so calling it directly from an
+async route blocks the event loop for the full Intervals.icu round trip. Route
+such calls through ``run`` instead; the pool is sized separately from the
+default executor so upstream I/O cannot starve other ``to_thread`` work.
+"""
+
+import asyncio
+import functools
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from src.clients.intervals import IntervalsClient
+
+T = TypeVar("T")
+
+UPSTREAM_POOL_SIZE = int(os.getenv("UPSTREAM_POOL_SIZE", "32"))
+
+# Concurrent upstream calls per user, so one user with many open tabs can't
+# take over the shared pool (a dashboard load needs about four)
+PER_USER_UPSTREAM_LIMIT = int(os.getenv("PER_USER_UPSTREAM_LIMIT", "4"))
+
+_pool = ThreadPoolExecutor(
+    max_workers=UPSTREAM_POOL_SIZE, thread_name_prefix="upstream"
+)
+
+
+async def run(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking callable on the upstream pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_pool, functools.partial(fn, *args, **kwargs))
+
+
+# user_id -> semaphore; entries disappear once no call holds them
+_user_slots: "weakref.WeakValueDictionary[str, asyncio.Semaphore]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _user_slot(user_id: str) -> asyncio.Semaphore:
+    slot = _user_slots.get(user_id)
+    if slot is None:
+        slot = asyncio.Semaphore(PER_USER_UPSTREAM_LIMIT)
+        _user_slots[user_id] = slot
+    return slot
+
+
+async def run_for_user(
+    user_id: str, fn: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """``run`` with at most PER_USER_UPSTREAM_LIMIT calls per user in flight.
+
+    Calls over the limit wait here without occupying a pool thread.
+    """
+    async with _user_slot(user_id):
+        return await run(fn, *args, **kwargs)
+
+
+def _with_own_client(config, call: Callable[[IntervalsClient], T]) -> T:
+    client = IntervalsClient(config)
+    try:
+        return call(client)
+    finally:
+        client.session.close()
+
+
+async def run_intervals(
+    user_id: str, config, call: Callable[[IntervalsClient], T]
+) -> T:
+    """Run one Intervals.icu call for ``user_id`` on a fresh client.
+
+    requests sessions are not thread-safe, so concurrent calls each get their
+    own client.
+    """
+    return await run_for_user(user_id, _with_own_client, config, call)
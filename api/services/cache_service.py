@@ -1,30 +1,47 @@
 """Cache service for TTL-based caching of Intervals.icu API data.
 
 Provides optimized TTL caching to reduce API calls to Intervals.icu.
-Different data types have different TTL values based on update frequency.
+Each key gets a short/normal/long freshness policy based on how often its data
+changes; within a policy, values that were slow to generate live longer.
 Cache can be invalidated manually after workout sync or via refresh parameter.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Any, Optional, Callable
+import time
+from typing import Any, Awaitable, NamedTuple, Optional, Callable
 from datetime import datetime
-from cachetools import TTLCache
-from functools import wraps
+from cachetools import LFUCache, TLRUCache, TTLCache
+from fastapi import Response
+from functools import partial, wraps
+from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
-# Optimized TTL values based on data update frequency
-TTL_SETTINGS = {
-    "wellness": 1 * 60 * 60,      # 1 hour - wellness data changes daily
-    "fitness": 2 * 60 * 60,        # 2 hours - training metrics update with new activities
-    "activities": 3 * 60 * 60,     # 3 hours - recent activities
-    "calendar": 2 * 60 * 60,       # 2 hours - weekly calendar/planned workouts
-    "profile": 6 * 60 * 60,        # 6 hours - user profile/settings (rarely change)
-    "sport_settings": 6 * 60 * 60, # 6 hours - FTP, zones (rarely change)
+# Freshness policies: (min_ttl, max_ttl) in seconds
+TTL_POLICIES = {
+    "short": (10 * 60, 30 * 60),            # 10-30 minutes
+    "normal": (1 * 60 * 60, 2 * 60 * 60),   # 1-2 hours
+    "long": (6 * 60 * 60, 12 * 60 * 60),    # 6-12 hours
 }
 
-# Default TTL for backward compatibility
-DEFAULT_TTL = 2 * 60 * 60  # 2 hours (reduced from 6 hours)
+# Policy per cache key (exact key first, then the part before ":")
+KEY_TTL_POLICIES = {
+    "wellness": "normal",         # wellness data changes daily
+    "fitness": "normal",          # training metrics update with new activities
+    "fitness:profile": "long",    # FTP, weight (rarely change)
+    "activities": "short",        # new rides show up within minutes
+    "activities_raw": "short",
+    "calendar": "normal",         # weekly calendar/planned workouts
+    "profile": "long",            # user profile/settings (rarely change)
+    "sport_settings": "long",     # FTP, zones (rarely change)
+    "athlete": "long",            # raw athlete payload behind both of the above
+}
+DEFAULT_TTL_POLICY = "normal"
+
+# Each second spent generating a value adds this much TTL (within policy bounds)
+TTL_PER_GENERATION_SECOND = 10 * 60
 
 # Cache key prefixes
 CACHE_KEYS = {
@@ -32,32 +49,93 @@ CACHE_KEYS = {
     "fitness_snapshot": "fitness:snapshot",
     "wellness": "wellness",
     "activities": "activities",
+    "activities_raw": "activities_raw",
     "profile": "profile",
     "calendar": "calendar",
     "sport_settings": "sport_settings",
+    "athlete": "athlete",
+}
+
+class _CacheEntry(NamedTuple):
+    value: Any
+    policy: str
+    ttl: float
+    generated_at: float
+
+
+# User-specific caches: user_id -> TLRUCache of _CacheEntry (per-entry TTL).
+# Bounded with LFU eviction so rarely seen users are dropped first instead of
+# the map growing with every user the process has served.
+MAX_CACHED_USERS = 2000
+_user_caches: LFUCache = LFUCache(maxsize=MAX_CACHED_USERS)
+
+# Last known good values, kept past their TTL so get_or_compute can serve them
+# while Intervals.icu is failing: (user_id, cache_key) -> value
+STALE_TTL = 24 * 60 * 60  # 24 hours
+_stale_values: TTLCache = TTLCache(maxsize=10000, ttl=STALE_TTL)
+
+# How long past its TTL (as a fraction of the TTL) an entry may still be served
+# while it is refreshed in the background
+REVALIDATE_WINDOW = 1.0
+
+# Background refresh tasks, referenced until done so they aren't collected
+_background_refreshes: set[asyncio.Task] = set()
+
+# Loads currently running in get_or_compute: (user_id, cache_key) -> Task
+_inflight: dict[tuple[str, str], asyncio.Task] = {}
+
+# Short TTLs for admin dashboard stats - shared across admins, polled on
+# auto-refresh, and fine to be a minute or two stale
+ADMIN_STATS_TTL = {
+    "overview": 60,
+    "users": 2 * 60,
+    "workouts": 2 * 60,
 }
 
-# User-specific caches: user_id -> TTLCache
-_user_caches: dict[str, TTLCache] = {}
+_admin_stats_caches: dict[str, TTLCache] = {
+    name: TTLCache(maxsize=64, ttl=ttl) for name, ttl in ADMIN_STATS_TTL.items()
+}
+
+
+def _entry_expiry(_key: str, entry: _CacheEntry, now: float) -> float:
+    return now + entry.ttl
+
+
+def _revalidate_until(entry: _CacheEntry) -> float:
+    return entry.generated_at + entry.ttl * (1 + REVALIDATE_WINDOW)
+
 
+def get_ttl_policy(cache_key: str) -> str:
+    """Return the freshness policy name for a cache key."""
+    policy = KEY_TTL_POLICIES.get(cache_key)
+    if policy is None:
+        policy = KEY_TTL_POLICIES.get(cache_key.split(":", 1)[0], DEFAULT_TTL_POLICY)
+    return policy
 
-def get_user_cache(
-    user_id: str, maxsize: int = 100, ttl: int = DEFAULT_TTL
-) -> TTLCache:
-    """Get or create a TTL cache for a specific user.
+
+def compute_ttl(policy: str, gen_ms: float = 0) -> float:
+    """TTL in seconds for a value that took ``gen_ms`` to generate."""
+    min_ttl, max_ttl = TTL_POLICIES[policy]
+    ttl = min_ttl + (gen_ms / 1000) * TTL_PER_GENERATION_SECOND
+    return min(max(ttl, min_ttl), max_ttl)
+
+
+def get_user_cache(user_id: str, maxsize: int = 100) -> TLRUCache:
+    """Get or create a per-entry TTL cache for a specific user.
 
     Args:
         user_id: The user's unique identifier.
         maxsize: Maximum number of items in the cache.
-        ttl: Time-to-live in seconds (default: 6 hours).
 
     Returns:
-        TTLCache instance for the user.
+        TLRUCache instance for the user.
     """
-    if user_id not in _user_caches:
-        _user_caches[user_id] = TTLCache(maxsize=maxsize, ttl=ttl)
+    cache = _user_caches.get(user_id)
+    if cache is None:
+        cache = TLRUCache(maxsize=maxsize, ttu=_entry_expiry)
+        _user_caches[user_id] = cache
         logger.debug(f"Created new cache for user {user_id[:8]}...")
-    return _user_caches[user_id]
+    return cache
 
 
 def get_cached(user_id: str, cache_key: str) -> Optional[Any]:
@@ -71,25 +149,227 @@ def get_cached(user_id: str, cache_key: str) -> Optional[Any]:
         Cached value or None if not found/expired.
     """
     cache = get_user_cache(user_id)
-    value = cache.get(cache_key)
-    if value is not None:
+    entry = cache.get(cache_key)
+    if entry is not None:
         logger.debug(f"Cache HIT for user {user_id[:8]}... key={cache_key}")
-    else:
-        logger.debug(f"Cache MISS for user {user_id[:8]}... key={cache_key}")
-    return value
+        return entry.value
+    logger.debug(f"Cache MISS for user {user_id[:8]}... key={cache_key}")
+    return None
 
 
-def set_cached(user_id: str, cache_key: str, value: Any) -> None:
+def set_cached(
+    user_id: str,
+    cache_key: str,
+    value: Any,
+    policy: Optional[str] = None,
+    gen_ms: float = 0,
+) -> _CacheEntry:
     """Set a cached value for a user.
 
     Args:
         user_id: The user's unique identifier.
         cache_key: The cache key to store.
         value: The value to cache.
+        policy: "short", "normal" or "long"; defaults to the key's policy.
+        gen_ms: How long the value took to generate, in milliseconds.
+
+    Returns:
+        The stored cache entry.
     """
+    policy = policy or get_ttl_policy(cache_key)
+    ttl = compute_ttl(policy, gen_ms)
     cache = get_user_cache(user_id)
-    cache[cache_key] = value
-    logger.debug(f"Cache SET for user {user_id[:8]}... key={cache_key}")
+    entry = _CacheEntry(value, policy, ttl, time.time())
+    cache[cache_key] = entry
+    logger.debug(
+        f"Cache SET for user {user_id[:8]}... key={cache_key} "
+        f"policy={policy} ttl={int(ttl)}s"
+    )
+    return entry
+
+
+async def _load_and_cache(
+    user_id: str,
+    cache_key: str,
+    loader: Callable[[], Awaitable[Any]],
+) -> tuple[Any, str]:
+    flight_key = (user_id, cache_key)
+    started = time.perf_counter()
+    try:
+        value = await loader()
+    except Exception as e:
+        stale = _stale_values.get(flight_key)
+        if stale is None:
+            raise
+        logger.warning(
+            f"Serving stale cache for user {user_id[:8]}... key={cache_key}: {e}"
+        )
+        return stale.value, "stale-if-error"
+
+    gen_ms = (time.perf_counter() - started) * 1000
+    _stale_values[flight_key] = set_cached(user_id, cache_key, value, gen_ms=gen_ms)
+    return value, "miss"
+
+
+def _finish_load(flight_key: tuple[str, str], task: asyncio.Task) -> None:
+    if _inflight.get(flight_key) is task:
+        del _inflight[flight_key]
+    if not task.cancelled():
+        task.exception()  # Mark retrieved when every waiter has gone away
+
+
+async def _load_shared(
+    user_id: str,
+    cache_key: str,
+    loader: Callable[[], Awaitable[Any]],
+) -> tuple[Any, str]:
+    """Run ``loader`` once per (user, key) and cache its result.
+
+    Returns ``(value, status)`` where status is "miss" for a fresh value or
+    "stale-if-error" when ``loader`` failed and the last good value was used.
+    The load runs in a task owned by the cache and every caller (including the
+    one that started it) awaits it shielded, so a disconnecting client can't
+    cancel the load for the others waiting on it.
+    """
+    flight_key = (user_id, cache_key)
+    task = _inflight.get(flight_key)
+    if task is not None:
+        logger.debug(f"Cache JOIN for user {user_id[:8]}... key={cache_key}")
+    else:
+        task = asyncio.create_task(_load_and_cache(user_id, cache_key, loader))
+        _inflight[flight_key] = task
+        task.add_done_callback(partial(_finish_load, flight_key))
+    return await asyncio.shield(task)
+
+
+def _log_background_refresh(task: asyncio.Task) -> None:
+    _background_refreshes.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Background cache refresh failed: {task.exception()}")
+
+
+async def get_or_compute_with_status(
+    user_id: str,
+    cache_key: str,
+    loader: Callable[[], Awaitable[Any]],
+    refresh: bool = False,
+) -> tuple[Any, str]:
+    """Return ``(value, status)`` for a cached value, computing it on a miss.
+
+    Concurrent misses for the same user and key share a single ``loader`` call
+    instead of each hitting the upstream API. Within REVALIDATE_WINDOW of
+    expiring, the previous value is returned immediately ("stale") while a
+    background ``loader`` call refreshes it. If ``loader`` fails, the last
+    known good value (up to STALE_TTL old) is returned ("stale-if-error").
+
+    Args:
+        user_id: The user's unique identifier.
+        cache_key: The cache key to read and store.
+        loader: Coroutine function that computes a fresh value.
+        refresh: If True, skip the cache read and always wait for a new value.
+
+    Returns:
+        The value and one of "hit", "miss", "stale" or "stale-if-error".
+    """
+    if not refresh:
+        value = get_cached(user_id, cache_key)
+        if value is not None:
+            return value, "hit"
+
+        flight_key = (user_id, cache_key)
+        stale = _stale_values.get(flight_key)
+        if stale is not None and time.time() < _revalidate_until(stale):
+            if flight_key not in _inflight:
+                task = asyncio.create_task(_load_shared(user_id, cache_key, loader))
+                _background_refreshes.add(task)
+                task.add_done_callback(_log_background_refresh)
+            logger.debug(f"Cache STALE for user {user_id[:8]}... key={cache_key}")
+            return stale.value, "stale"
+
+    return await _load_shared(user_id, cache_key, loader)
+
+
+async def get_or_compute(
+    user_id: str,
+    cache_key: str,
+    loader: Callable[[], Awaitable[Any]],
+    refresh: bool = False,
+) -> Any:
+    """Return a cached value, computing it with ``loader`` on a miss.
+
+    See get_or_compute_with_status for the coalescing and stale fallbacks.
+    """
+    value, _status = await get_or_compute_with_status(
+        user_id, cache_key, loader, refresh=refresh
+    )
+    return value
+
+
+class _JsonBody(NamedTuple):
+    body: bytes
+    etag: str
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header value matches ``etag`` (weak compare)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+async def get_or_compute_json(
+    user_id: str,
+    cache_key: str,
+    loader: Callable[[], Awaitable[BaseModel]],
+    refresh: bool = False,
+    if_none_match: Optional[str] = None,
+) -> Response:
+    """Like get_or_compute, but caches the serialized JSON response body.
+
+    The model returned by ``loader`` is serialized once on a miss and stored
+    with an ETag; cache hits return the stored bytes directly, so FastAPI skips
+    response validation and encoding. When the client's If-None-Match matches,
+    an empty 304 is returned instead. The X-Cache header reports how the body
+    was obtained (see get_or_compute_with_status). The route's response_model
+    still documents the shape.
+
+    Args:
+        user_id: The user's unique identifier.
+        cache_key: The cache key to read and store.
+        loader: Coroutine function that builds the response model.
+        refresh: If True, skip the cache read and always recompute.
+        if_none_match: The request's If-None-Match header, if any.
+
+    Returns:
+        A JSON Response with the cached, fresh, or stale body, or a 304.
+    """
+
+    async def _render() -> _JsonBody:
+        body = (await loader()).model_dump_json().encode()
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        return _JsonBody(body, etag)
+
+    cached, status = await get_or_compute_with_status(
+        user_id, cache_key, _render, refresh=refresh
+    )
+    # Browsers keep the body but revalidate it on every request
+    headers = {
+        "ETag": cached.etag,
+        "Cache-Control": "private, no-cache",
+        "X-Cache": status,
+    }
+    if _etag_matches(if_none_match, cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+def _key_matches(cache_key: str, keys: list[str]) -> bool:
+    """Whether ``cache_key`` is one of ``keys`` or a sub-key ("calendar:...")."""
+    return any(cache_key == key or cache_key.startswith(f"{key}:") for key in keys)
 
 
 def clear_user_cache(user_id: str, keys: Optional[list[str]] = None) -> None:
@@ -97,18 +377,34 @@ def clear_user_cache(user_id: str, keys: Optional[list[str]] = None) -> None:
 
     Args:
         user_id: The user's unique identifier.
-        keys: Optional list of specific keys to clear. If None, clears all.
+        keys: Optional list of keys to clear; each also clears its sub-keys
+            (e.g. "calendar" clears "calendar:2026-10-12"). If None, clears all.
     """
+    if not keys:
+        # Full clears (e.g. Intervals.icu disconnect) also drop stale fallbacks
+        for flight_key in [k for k in _stale_values.keys() if k[0] == user_id]:
+            _stale_values.pop(flight_key, None)
+    else:
+        # Invalidated data may still cover an upstream error, but must not be
+        # served while revalidating
+        for flight_key in [
+            k
+            for k in _stale_values.keys()
+            if k[0] == user_id and _key_matches(k[1], keys)
+        ]:
+            stale = _stale_values.get(flight_key)
+            if stale is not None:
+                _stale_values[flight_key] = stale._replace(ttl=0)
+
     if user_id not in _user_caches:
         return
 
     cache = _user_caches[user_id]
 
     if keys:
-        for key in keys:
-            if key in cache:
-                del cache[key]
-                logger.info(f"Cache cleared for user {user_id[:8]}... key={key}")
+        for key in [k for k in cache.keys() if _key_matches(k, keys)]:
+            cache.pop(key, None)
+            logger.info(f"Cache cleared for user {user_id[:8]}... key={key}")
     else:
         cache.clear()
         logger.info(f"Cache fully cleared for user {user_id[:8]}...")
@@ -116,8 +412,8 @@ def clear_user_cache(user_id: str, keys: Optional[list[str]] = None) -> None:
 
 def clear_all_caches() -> None:
     """Clear all user caches (for admin/debugging purposes)."""
-    global _user_caches
-    _user_caches = {}
+    _user_caches.clear()
+    _stale_values.clear()
     logger.info("All user caches cleared")
 
 
@@ -128,14 +424,14 @@ def get_cache_stats(user_id: str) -> dict:
         user_id: The user's unique identifier.
 
     Returns:
-        Dictionary with cache statistics including TTL settings.
+        Dictionary with cache statistics including TTL policies.
     """
     if user_id not in _user_caches:
         return {
             "exists": False,
             "size": 0,
             "keys": [],
-            "ttl_settings": TTL_SETTINGS,
+            "ttl_policies": TTL_POLICIES,
         }
 
     cache = _user_caches[user_id]
@@ -143,7 +439,44 @@ def get_cache_stats(user_id: str) -> dict:
         "exists": True,
         "size": len(cache),
         "maxsize": cache.maxsize,
-        "ttl": cache.ttl,
         "keys": list(cache.keys()),
-        "ttl_settings": TTL_SETTINGS,
+        "entries": {
+            key: {
+                "policy": entry.policy,
+                "ttl": int(entry.ttl),
+                "generated_at": datetime.fromtimestamp(entry.generated_at).isoformat(),
+            }
+            for key, entry in cache.items()
+        },
+        "ttl_policies": TTL_POLICIES,
     }
+
+
+async def get_or_set_admin_stats(
+    name: str, key: str, loader: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Return cached admin stats, computing them with ``loader`` on a miss.
+
+    Args:
+        name: Stats endpoint name (a key of ADMIN_STATS_TTL).
+        key: Cache key within that endpoint (e.g. the query window).
+        loader: Coroutine function that computes the stats.
+
+    Returns:
+        The cached or freshly computed stats.
+    """
+    cache = _admin_stats_caches[name]
+    value = cache.get(key)
+    if value is not None:
+        logger.debug(f"Admin stats cache HIT {name}:{key}")
+        return value
+    value = await loader()
+    cache[key] = value
+    return value
+
+
+def clear_admin_stats_cache() -> None:
+    """Clear all cached admin stats (e.g. after log cleanup)."""
+    for cache in _admin_stats_caches.values():
+        cache.clear()
+    logger.info("Admin stats caches cleared")
@@ -4,7 +4,13 @@ import asyncio
 from dataclasses import dataclass
 
 from api.schemas import AthleteProfile
-from api.services.cache_service import get_cached, set_cached
+from api.services.blocking import run_for_user
+from api.services.cache_service import (
+    CACHE_KEYS,
+    get_cached,
+    get_or_compute,
+    set_cached,
+)
 from src.clients.intervals import IntervalsClient
 from src.services.data_processor import DataProcessor, TrainingMetrics, WellnessMetrics
 
@@ -50,13 +56,25 @@ def _fetch_athlete_profile(config) -> dict:
         client.session.close()
 
 
+def select_sport_settings(athlete_data: dict, sport: str = "Ride") -> dict:
+    """Pick the sportSettings entry for ``sport`` from an athlete payload.
+
+    Builds a type -> settings map in one pass (first entry wins per type) and
+    falls back to the first entry when no settings cover ``sport``.
+    """
+    sport_settings = athlete_data.get("sportSettings") or []
+    by_type: dict[str, dict] = {}
+    for settings in sport_settings:
+        for sport_type in settings.get("types") or ():
+            by_type.setdefault(sport_type, settings)
+    if sport in by_type:
+        return by_type[sport]
+    return sport_settings[0] if sport_settings else {}
+
+
 def build_athlete_profile(athlete_data: dict) -> AthleteProfile:
     """Convert Intervals athlete payload to the API profile shape."""
-    sport_settings = athlete_data.get("sportSettings", [])
-    ride_settings = next(
-        (s for s in sport_settings if "Ride" in s.get("types", [])),
-        sport_settings[0] if sport_settings else {},
-    )
+    ride_settings = select_sport_settings(athlete_data, "Ride")
 
     ftp = ride_settings.get("ftp")
     lthr = ride_settings.get("lthr")
@@ -67,7 +85,7 @@ def build_athlete_profile(athlete_data: dict) -> AthleteProfile:
     vo2max_estimate = mmp_model.get("vo2max") if mmp_model else None
     w_per_kg = round(ftp / weight, 2) if ftp and weight else None
 
-    return AthleteProfile(
+    return AthleteProfile.model_construct(
         ftp=ftp,
         max_hr=max_hr,
         lthr=lthr,
@@ -93,12 +111,14 @@ async def get_fitness_snapshot(
     processor = processor or DataProcessor()
 
     activities, wellness_entries = await asyncio.gather(
-        asyncio.to_thread(
+        run_for_user(
+            user_id,
             _fetch_recent_activities,
             intervals_client.config,
             ACTIVITY_LOOKBACK_DAYS,
         ),
-        asyncio.to_thread(
+        run_for_user(
+            user_id,
             _fetch_recent_wellness,
             intervals_client.config,
             WELLNESS_LOOKBACK_DAYS,
@@ -119,6 +139,27 @@ async def get_fitness_snapshot(
     return snapshot
 
 
+async def get_cached_athlete_data(
+    user_id: str,
+    intervals_client: IntervalsClient,
+    *,
+    refresh: bool = False,
+) -> dict:
+    """Fetch and cache the raw Intervals athlete payload (long TTL policy).
+
+    `/fitness` and `/sport-settings` both derive from it, so a miss on either
+    one (or on another sport) doesn't refetch the athlete.
+    """
+    return await get_or_compute(
+        user_id,
+        CACHE_KEYS["athlete"],
+        lambda: run_for_user(
+            user_id, _fetch_athlete_profile, intervals_client.config
+        ),
+        refresh=refresh,
+    )
+
+
 async def get_cached_athlete_profile(
     user_id: str,
     intervals_client: IntervalsClient,
@@ -131,9 +172,8 @@ async def get_cached_athlete_profile(
         if cached:
             return cached
 
-    athlete_data = await asyncio.to_thread(
-        _fetch_athlete_profile,
-        intervals_client.config,
+    athlete_data = await get_cached_athlete_data(
+        user_id, intervals_client, refresh=refresh
     )
     profile = build_athlete_profile(athlete_data)
     set_cached(user_id, FITNESS_PROFILE_CACHE_KEY, profile)
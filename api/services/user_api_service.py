@@ -17,6 +17,7 @@ from src.clients.llm import LLMClient
 from src.config import IntervalsConfig, LLMConfig, UserProfile
 from src.services.data_processor import DataProcessor
 from api.schemas import GeneratedWorkout
+from api.services.blocking import run
 
 logger = logging.getLogger(__name__)
 
@@ -502,7 +503,9 @@ async def get_todays_workout(
         intervals = await get_user_intervals_client(user_id)
 
         # Fetch events for the target date
-        events = intervals.get_events(target_date, target_date)
+        events = await run(
+            intervals.get_events, target_date, target_date, category="WORKOUT"
+        )
 
         # Filter for WORKOUT category only (exclude ACTIVITY, NOTE, etc.)
         workout_events = [e for e in events if e.get("category") == "WORKOUT"]
@@ -558,55 +561,72 @@ async def sync_workout_from_intervals(user_id: str, event: dict) -> None:
 
     Preserves existing metadata (design_goal) if the workout already exists.
     """
+    await sync_workouts_from_intervals(user_id, [event])
+
+
+async def sync_workouts_from_intervals(user_id: str, events: list[dict]) -> None:
+    """Sync workout events from Intervals.icu to local DB in one round-trip each.
+
+    Existing metadata is read with a single query and all rows are written with
+    a single upsert. Rows are keyed by (user_id, workout_date), so when several
+    events share a date the last one wins, as with per-event syncing.
+    """
+    if not events:
+        return
+
     supabase = get_supabase_admin_client()
-    target_date = event["start_date_local"][:10]
+    events_by_date = {event["start_date_local"][:10]: event for event in events}
 
-    # Check if exists
+    # Fetch existing metadata for all dates at once
     existing = (
         supabase.table("saved_workouts")
-        .select("design_goal, workout_type")
+        .select("workout_date, design_goal, workout_type")
         .eq("user_id", user_id)
-        .eq("workout_date", target_date)
-        .maybe_single()
+        .in_("workout_date", list(events_by_date))
         .execute()
     )
+    existing_by_date = {row["workout_date"]: row for row in (existing.data or [])}
+
+    today = date.today().isoformat()
+    rows = []
+    for target_date, event in events_by_date.items():
+        # Prepare data
+        description = event.get("description", "") or ""
+        moving_time = event.get("moving_time", 0)
+
+        data = {
+            "user_id": user_id,
+            "name": event.get("name"),
+            "workout_date": target_date,
+            "workout_text": description,
+            "estimated_tss": event.get("icu_training_load"),
+            "duration_minutes": moving_time // 60 if moving_time else 0,
+            "intervals_event_id": event.get("id"),
+            "updated_at": today,
+        }
+
+        # Preserve or set default metadata
+        existing_data = existing_by_date.get(target_date)
+        if existing_data:
+            data["design_goal"] = existing_data.get("design_goal")
+            data["workout_type"] = existing_data.get("workout_type") or event.get(
+                "type", "Ride"
+            )
+        else:
+            # New sync
+            data["design_goal"] = None  # No AI goal for external workouts
+            data["workout_type"] = event.get("type", "Ride")
 
-    existing_data = existing.data if existing else None
-
-    # Prepare data
-    description = event.get("description", "") or ""
-    moving_time = event.get("moving_time", 0)
-
-    data = {
-        "user_id": user_id,
-        "name": event.get("name"),
-        "workout_date": target_date,
-        "workout_text": description,
-        "estimated_tss": event.get("icu_training_load"),
-        "duration_minutes": moving_time // 60 if moving_time else 0,
-        "intervals_event_id": event.get("id"),
-        "updated_at": date.today().isoformat(),
-    }
-
-    # Preserve or set default metadata
-    if existing_data:
-        data["design_goal"] = existing_data.get("design_goal")
-        # Only overwrite type if not set in DB, or update if we want (kept simple here)
-        data["workout_type"] = existing_data.get("workout_type") or event.get(
-            "type", "Ride"
-        )
-    else:
-        # New sync
-        data["design_goal"] = None  # No AI goal for external workouts
-        data["workout_type"] = event.get("type", "Ride")
+        rows.append(data)
 
     # Upsert
     try:
         supabase.table("saved_workouts").upsert(
-            data, on_conflict="user_id, workout_date"
+            rows, on_conflict="user_id, workout_date"
         ).execute()
     except Exception as e:
-        logger.error(f"Failed to sync workout {event.get('id')}: {e}")
+        event_ids = [event.get("id") for event in events_by_date.values()]
+        logger.error(f"Failed to sync workouts {event_ids}: {e}")
 
 
 async def cleanup_stale_workouts(
@@ -640,7 +660,8 @@ async def cleanup_stale_workouts(
             return 0
 
         # Find workouts that are not in the valid event IDs
-        deleted_count = 0
+        valid_ids = {str(eid) for eid in valid_event_ids}
+        stale_ids = []
         for workout in result.data:
             event_id = workout.get("intervals_event_id")
             # Skip if no event ID (manually created, not synced)
@@ -648,19 +669,20 @@ async def cleanup_stale_workouts(
                 continue
 
             # Delete if event ID not in valid list
-            if str(event_id) not in [str(eid) for eid in valid_event_ids]:
+            if str(event_id) not in valid_ids:
                 logger.info(
                     f"Deleting stale workout {workout['id']} (event {event_id}) for user {user_id}"
                 )
-                supabase.table("saved_workouts").delete().eq(
-                    "id", workout["id"]
-                ).execute()
-                deleted_count += 1
+                stale_ids.append(workout["id"])
+
+        if not stale_ids:
+            return 0
 
-        if deleted_count > 0:
-            logger.info(f"Cleaned up {deleted_count} stale workouts for user {user_id}")
+        # One DELETE for all stale rows
+        supabase.table("saved_workouts").delete().in_("id", stale_ids).execute()
+        logger.info(f"Cleaned up {len(stale_ids)} stale workouts for user {user_id}")
 
-        return deleted_count
+        return len(stale_ids)
 
     except Exception as e:
         logger.error(f"Failed to cleanup stale workouts for user {user_id}: {e}")
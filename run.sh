@@ -35,7 +35,7 @@ trap cleanup SIGINT SIGTERM
 log_backend "Starting FastAPI on http://localhost:8005 ..."
 source "$ROOT/.venv/bin/activate" 2>/dev/null || true
 cd "$ROOT"
-uvicorn api.main:app --reload --port 8005 2>&1 | sed "s/^/$(echo -e "${BLUE}[backend]${RESET}")  /" &
+ALLOW_GIT_SUBPROCESS=1 uvicorn api.main:app --reload --port 8005 2>&1 | sed "s/^/$(echo -e "${BLUE}[backend]${RESET}")  /" &
 BACKEND_PID=$!
 
 # Frontend
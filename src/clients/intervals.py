@@ -17,6 +17,41 @@ from ..config import IntervalsConfig
 
 logger = logging.getLogger(__name__)
 
+# Connections kept per host in the shared pool; matches the API's upstream
+# thread pool so concurrent calls don't open throwaway connections
+POOL_MAXSIZE = 32
+
+
+class _SharedHTTPAdapter(HTTPAdapter):
+    """Process-wide adapter whose connection pool outlives individual sessions.
+
+    urllib3's pool is thread-safe and authentication is applied per request,
+    so every client (and user) can reuse the same keep-alive TLS connections.
+    """
+
+    def close(self) -> None:
+        # Session.close() closes mounted adapters; keep the shared pool open
+        pass
+
+
+_shared_adapter: Optional[HTTPAdapter] = None
+
+
+def _get_shared_adapter() -> HTTPAdapter:
+    global _shared_adapter
+    if _shared_adapter is None:
+        # Configure retry strategy for rate limiting
+        retry_strategy = Retry(
+            total=3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"],
+            backoff_factor=1,  # 1s, 2s, 4s between retries
+        )
+        _shared_adapter = _SharedHTTPAdapter(
+            max_retries=retry_strategy, pool_maxsize=POOL_MAXSIZE
+        )
+    return _shared_adapter
+
 
 class IntervalsAPIError(Exception):
     """Exception raised for Intervals.icu API errors."""
@@ -56,7 +91,7 @@ class IntervalsClient:
         self.session = self._create_session()
 
     def _create_session(self) -> requests.Session:
-        """Create a requests session with retry logic.
+        """Create a requests session with retry logic and pooled connections.
 
         Returns:
             Configured requests Session.
@@ -81,14 +116,8 @@ class IntervalsClient:
             }
         )
 
-        # Configure retry strategy for rate limiting
-        retry_strategy = Retry(
-            total=3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"],
-            backoff_factor=1,  # 1s, 2s, 4s between retries
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Retrying adapter with a connection pool shared by all clients
+        adapter = _get_shared_adapter()
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
@@ -270,6 +299,7 @@ class IntervalsClient:
         oldest: date | str,
         newest: date | str,
         calendar_id: Optional[int] = None,
+        category: Optional[str] = None,
     ) -> list[dict]:
         """Fetch calendar events within a date range.
 
@@ -277,6 +307,8 @@ class IntervalsClient:
             oldest: Start date (inclusive).
             newest: End date (inclusive).
             calendar_id: Optional calendar ID to filter events.
+            category: Optional event category filter applied by Intervals.icu
+                (e.g. "WORKOUT"; comma-separate several).
 
         Returns:
             List of event objects.
@@ -288,6 +320,8 @@ class IntervalsClient:
         }
         if calendar_id is not None:
             params["calendar_id"] = calendar_id
+        if category is not None:
+            params["category"] = category
 
         return self._make_request("GET", endpoint, params=params) or []
 
@@ -439,7 +473,7 @@ class IntervalsClient:
         Returns:
             Existing workout event if found, None otherwise.
         """
-        events = self.get_events(target_date, target_date)
+        events = self.get_events(target_date, target_date, category="WORKOUT")
 
         for event in events:
             if event.get("category") == "WORKOUT":
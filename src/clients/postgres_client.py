@@ -0,0 +1,69 @@
+"""Direct Postgres connection pool (optional).
+
+Admin statistics are plain SQL functions, so when SUPABASE_DB_URL is set and
+asyncpg is installed they run over a pooled connection instead of PostgREST.
+Without either, callers fall back to the Supabase REST client.
+"""
+
+import logging
+import os
+from typing import Any, Optional
+
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+# Direct (session-mode) connection string. Prepared statements are cached per
+# connection, so the transaction-mode pooler on port 6543 is not supported.
+SUPABASE_DB_URL = os.getenv("SUPABASE_DB_URL", "")
+
+_pool: Optional[Any] = None
+
+
+async def init_pg_pool() -> Optional[Any]:
+    """Create the asyncpg pool if configured; returns None when unavailable."""
+    global _pool
+    if _pool is not None or not SUPABASE_DB_URL:
+        return _pool
+
+    try:
+        import asyncpg
+    except ImportError:
+        logger.warning(
+            "SUPABASE_DB_URL is set but asyncpg is not installed "
+            "(pip install asyncpg); using Supabase REST"
+        )
+        return None
+
+    try:
+        _pool = await asyncpg.create_pool(
+            dsn=SUPABASE_DB_URL,
+            min_size=2,
+            max_size=10,
+            statement_cache_size=256,
+            timeout=10,  # Per-connection connect timeout, keeps startup bounded
+        )
+    except Exception as e:
+        # Bad or unreachable URL must not stop the API from booting. The DSN
+        # holds the password, so only the error type/message is logged.
+        logger.warning(
+            f"Could not connect to SUPABASE_DB_URL ({type(e).__name__}: {e}); "
+            "using Supabase REST"
+        )
+        _pool = None
+    return _pool
+
+
+async def close_pg_pool() -> None:
+    """Close the pool on shutdown."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+def get_pg_pool() -> Optional[Any]:
+    """Return the pool, or None when direct Postgres access is not configured."""
+    return _pool
@@ -1,7 +1,11 @@
 """Supabase client configuration."""
 
 import os
+from functools import lru_cache
+from typing import Optional
+
 from dotenv import load_dotenv
+from jose import JWTError, jwt
 from supabase import create_client, Client
 
 # Load .env file
@@ -11,6 +15,7 @@ load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL", "")
 SUPABASE_ANON_KEY = os.getenv("SUPABASE_ANON_KEY", "")
 SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
+SUPABASE_JWT_SECRET = os.getenv("SUPABASE_JWT_SECRET", "")
 
 
 def get_supabase_client() -> Client:
@@ -20,8 +25,41 @@ def get_supabase_client() -> Client:
     return create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
 
 
+@lru_cache(maxsize=None)
+def get_supabase_auth_client() -> Client:
+    """Get a shared anon-key client for stateless token checks.
+
+    Only use this for ``auth.get_user(token)``. Sign-in/sign-up store a session
+    on the client, so those must keep using a fresh ``get_supabase_client()``.
+    """
+    return get_supabase_client()
+
+
+@lru_cache(maxsize=None)
 def get_supabase_admin_client() -> Client:
-    """Get Supabase client with service role key (for admin operations)."""
+    """Get Supabase client with service role key (for admin operations).
+
+    The service-role client carries no per-user session, so a single instance
+    is shared across requests instead of rebuilding it on every call.
+    """
     if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
         raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set")
     return create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
+
+
+def decode_supabase_jwt(token: str) -> Optional[dict]:
+    """Verify a Supabase access token locally and return its claims.
+
+    Returns None if SUPABASE_JWT_SECRET is not configured or the token is invalid.
+    """
+    if not SUPABASE_JWT_SECRET:
+        return None
+    try:
+        return jwt.decode(
+            token,
+            SUPABASE_JWT_SECRET,
+            algorithms=["HS256"],
+            audience="authenticated",
+        )
+    except JWTError:
+        return None
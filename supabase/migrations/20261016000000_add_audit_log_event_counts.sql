@@ -0,0 +1,13 @@
+-- Server-side GROUP BY for /admin/audit-logs/stats (avoids pulling every row into Python)
+CREATE OR REPLACE FUNCTION public.audit_log_event_counts()
+RETURNS TABLE (event_type text, n bigint)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT event_type, count(*) AS n
+  FROM public.audit_logs
+  GROUP BY event_type
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.audit_log_event_counts() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.audit_log_event_counts() TO service_role;
@@ -0,0 +1,25 @@
+-- Bounded batch delete for /admin/audit-logs/cleanup.
+-- Each call is its own short transaction and returns only the deleted row count,
+-- so the API loops until a batch comes back smaller than p_batch_size.
+CREATE OR REPLACE FUNCTION public.delete_audit_logs_batch(
+  p_cutoff timestamptz,
+  p_batch_size integer DEFAULT 10000
+)
+RETURNS bigint
+LANGUAGE sql
+AS $$
+  WITH doomed AS (
+    SELECT id FROM public.audit_logs
+    WHERE created_at < p_cutoff
+    LIMIT p_batch_size
+  ), deleted AS (
+    DELETE FROM public.audit_logs a
+    USING doomed d
+    WHERE a.id = d.id
+    RETURNING 1
+  )
+  SELECT count(*) FROM deleted
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.delete_audit_logs_batch(timestamptz, integer) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.delete_audit_logs_batch(timestamptz, integer) TO service_role;
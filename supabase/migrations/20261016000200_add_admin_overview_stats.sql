@@ -0,0 +1,41 @@
+-- Single round-trip for /admin/stats/overview (replaces five PostgREST calls)
+CREATE OR REPLACE FUNCTION public.admin_overview_stats(
+  p_today timestamptz,
+  p_week_ago timestamptz
+)
+RETURNS TABLE (
+  total_users bigint,
+  workouts_today bigint,
+  api_calls_today bigint,
+  api_calls_week bigint,
+  avg_response_time_ms integer
+)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT
+    (SELECT count(*) FROM public.user_settings),
+    (
+      SELECT count(*) FROM public.audit_logs
+      WHERE event_type = 'workout.generated' AND created_at >= p_today
+    ),
+    logs.api_calls_today,
+    logs.api_calls_week,
+    logs.avg_response_time_ms
+  FROM (
+    SELECT
+      count(*) FILTER (WHERE created_at >= p_today) AS api_calls_today,
+      count(*) FILTER (WHERE created_at >= p_week_ago) AS api_calls_week,
+      COALESCE(
+        floor(avg(response_time_ms) FILTER (
+          WHERE created_at >= p_today AND response_time_ms > 0
+        )),
+        0
+      )::integer AS avg_response_time_ms
+    FROM public.api_request_logs
+    WHERE created_at >= LEAST(p_today, p_week_ago)
+  ) logs
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.admin_overview_stats(timestamptz, timestamptz) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.admin_overview_stats(timestamptz, timestamptz) TO service_role;
@@ -0,0 +1,46 @@
+-- Server-side mean response time (zero/null timings ignored, floored like the old Python)
+CREATE OR REPLACE FUNCTION public.avg_response_time_since(p_since timestamptz)
+RETURNS integer
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT COALESCE(floor(avg(response_time_ms)), 0)::integer
+  FROM public.api_request_logs
+  WHERE created_at >= p_since AND response_time_ms > 0
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.avg_response_time_since(timestamptz) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.avg_response_time_since(timestamptz) TO service_role;
+
+-- Overview stats delegate the average to the shared function
+CREATE OR REPLACE FUNCTION public.admin_overview_stats(
+  p_today timestamptz,
+  p_week_ago timestamptz
+)
+RETURNS TABLE (
+  total_users bigint,
+  workouts_today bigint,
+  api_calls_today bigint,
+  api_calls_week bigint,
+  avg_response_time_ms integer
+)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT
+    (SELECT count(*) FROM public.user_settings),
+    (
+      SELECT count(*) FROM public.audit_logs
+      WHERE event_type = 'workout.generated' AND created_at >= p_today
+    ),
+    logs.api_calls_today,
+    logs.api_calls_week,
+    public.avg_response_time_since(p_today)
+  FROM (
+    SELECT
+      count(*) FILTER (WHERE created_at >= p_today) AS api_calls_today,
+      count(*) FILTER (WHERE created_at >= p_week_ago) AS api_calls_week
+    FROM public.api_request_logs
+    WHERE created_at >= LEAST(p_today, p_week_ago)
+  ) logs
+$$;
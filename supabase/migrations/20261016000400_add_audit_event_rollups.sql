@@ -0,0 +1,48 @@
+-- Server-side GROUP BY for /admin/stats/users and /admin/stats/workouts
+
+-- Per-day counts of one audit event type since a cutoff (UTC days)
+CREATE OR REPLACE FUNCTION public.daily_event_counts(
+  p_event_type text,
+  p_cutoff timestamptz
+)
+RETURNS TABLE (d date, n bigint)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT (created_at AT TIME ZONE 'UTC')::date AS d, count(*) AS n
+  FROM public.audit_logs
+  WHERE event_type = p_event_type AND created_at >= p_cutoff
+  GROUP BY 1
+  ORDER BY 1
+$$;
+
+-- Per-user counts of one audit event type, with the most recent email seen in details
+CREATE OR REPLACE FUNCTION public.event_user_counts(
+  p_event_type text,
+  p_cutoff timestamptz
+)
+RETURNS TABLE (user_id uuid, n bigint, email text)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT
+    user_id,
+    count(*) AS n,
+    (
+      array_agg(
+        COALESCE(NULLIF(details->>'email', ''), NULLIF(details->>'user_email', ''))
+        ORDER BY created_at DESC
+      ) FILTER (
+        WHERE COALESCE(NULLIF(details->>'email', ''), NULLIF(details->>'user_email', '')) IS NOT NULL
+      )
+    )[1] AS email
+  FROM public.audit_logs
+  WHERE event_type = p_event_type AND created_at >= p_cutoff AND user_id IS NOT NULL
+  GROUP BY user_id
+  ORDER BY n DESC, user_id
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.daily_event_counts(text, timestamptz) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.daily_event_counts(text, timestamptz) TO service_role;
+REVOKE EXECUTE ON FUNCTION public.event_user_counts(text, timestamptz) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.event_user_counts(text, timestamptz) TO service_role;
@@ -0,0 +1,13 @@
+-- Exact distinct active-user count for /admin/stats/users (one integer instead of every user_id row)
+CREATE OR REPLACE FUNCTION public.active_user_count_since(p_since timestamptz)
+RETURNS integer
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT count(DISTINCT user_id)::integer
+  FROM public.api_request_logs
+  WHERE created_at >= p_since AND user_id IS NOT NULL
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.active_user_count_since(timestamptz) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.active_user_count_since(timestamptz) TO service_role;
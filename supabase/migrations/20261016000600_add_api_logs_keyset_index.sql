@@ -0,0 +1,4 @@
+-- Composite index backing keyset pagination on /admin/api-logs
+-- (ORDER BY created_at DESC, id DESC with a (created_at, id) < cursor seek)
+CREATE INDEX IF NOT EXISTS "idx_api_logs_created_at_id"
+  ON "public"."api_request_logs" USING "btree" ("created_at" DESC, "id" DESC);
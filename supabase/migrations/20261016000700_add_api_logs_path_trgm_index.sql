@@ -0,0 +1,6 @@
+-- Trigram index so /admin/api-logs?path_contains=... (ILIKE '%substr%') can use an
+-- index instead of a sequential scan of api_request_logs
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA extensions;
+
+CREATE INDEX IF NOT EXISTS "idx_api_logs_path_trgm"
+  ON "public"."api_request_logs" USING "gin" ("path" "extensions"."gin_trgm_ops");
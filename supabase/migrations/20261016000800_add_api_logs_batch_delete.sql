@@ -0,0 +1,24 @@
+-- Bounded batch delete for /admin/api-logs/cleanup (mirrors delete_audit_logs_batch).
+-- Returns only the number of rows removed; the API loops until a short batch.
+CREATE OR REPLACE FUNCTION public.delete_api_request_logs_batch(
+  p_cutoff timestamptz,
+  p_batch_size integer DEFAULT 10000
+)
+RETURNS bigint
+LANGUAGE sql
+AS $$
+  WITH doomed AS (
+    SELECT id FROM public.api_request_logs
+    WHERE created_at < p_cutoff
+    LIMIT p_batch_size
+  ), deleted AS (
+    DELETE FROM public.api_request_logs l
+    USING doomed d
+    WHERE l.id = d.id
+    RETURNING 1
+  )
+  SELECT count(*) FROM deleted
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.delete_api_request_logs_batch(timestamptz, integer) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.delete_api_request_logs_batch(timestamptz, integer) TO service_role;
@@ -0,0 +1,251 @@
+-- Partition api_request_logs and audit_logs by day on created_at.
+--
+-- Every admin query filters on created_at >= X, so range partitions let the
+-- planner prune whole days, and retention becomes DROP TABLE on old partitions
+-- instead of a large DELETE. Partitions are managed with plain SQL + pg_cron
+-- (already enabled by the log cleanup migration), no pg_partman required.
+
+-- ============================================
+-- 1. Partition management helpers
+-- ============================================
+
+-- Create daily partitions <table>_pYYYYMMDD covering [p_start, p_end].
+-- If rows for a day already landed in <table>_default (e.g. the cron job
+-- missed a run), the default partition is detached, those rows are moved into
+-- the new partition, and it is re-attached; otherwise CREATE would fail on
+-- the overlapping range. Each day runs in its own subtransaction, so one
+-- failure is logged and skipped instead of aborting the remaining days.
+CREATE OR REPLACE FUNCTION public.ensure_log_partitions(
+  p_table text,
+  p_start date,
+  p_end date
+)
+RETURNS integer
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  d date := p_start;
+  part_name text;
+  default_name text := p_table || '_default';
+  has_default_rows boolean;
+  created integer := 0;
+BEGIN
+  WHILE d <= p_end LOOP
+    part_name := format('%s_p%s', p_table, to_char(d, 'YYYYMMDD'));
+    IF to_regclass(format('public.%I', part_name)) IS NULL THEN
+      BEGIN
+        EXECUTE format(
+          'SELECT EXISTS (SELECT 1 FROM public.%I WHERE created_at >= %L AND created_at < %L)',
+          default_name, d::timestamptz, (d + 1)::timestamptz
+        ) INTO has_default_rows;
+
+        IF has_default_rows THEN
+          EXECUTE format('ALTER TABLE public.%I DETACH PARTITION public.%I', p_table, default_name);
+        END IF;
+
+        EXECUTE format(
+          'CREATE TABLE public.%I PARTITION OF public.%I FOR VALUES FROM (%L) TO (%L)',
+          part_name, p_table, d::timestamptz, (d + 1)::timestamptz
+        );
+
+        IF has_default_rows THEN
+          EXECUTE format(
+            'INSERT INTO public.%I SELECT * FROM public.%I WHERE created_at >= %L AND created_at < %L',
+            part_name, default_name, d::timestamptz, (d + 1)::timestamptz
+          );
+          EXECUTE format(
+            'DELETE FROM public.%I WHERE created_at >= %L AND created_at < %L',
+            default_name, d::timestamptz, (d + 1)::timestamptz
+          );
+          EXECUTE format('ALTER TABLE public.%I ATTACH PARTITION public.%I DEFAULT', p_table, default_name);
+        END IF;
+
+        created := created + 1;
+      EXCEPTION WHEN others THEN
+        RAISE WARNING 'ensure_log_partitions: could not create %: %', part_name, SQLERRM;
+      END;
+    END IF;
+    d := d + 1;
+  END LOOP;
+  RETURN created;
+END;
+$$;
+
+-- Drop daily partitions that end on or before p_cutoff; returns rows removed.
+-- SECURITY DEFINER: partitions are owned by postgres, but the admin cleanup
+-- endpoints call this over REST as service_role, which can't DROP them.
+-- Restricted to the two partitioned log tables.
+CREATE OR REPLACE FUNCTION public.drop_log_partitions_before(
+  p_table text,
+  p_cutoff timestamptz
+)
+RETURNS bigint
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+  part record;
+  part_rows bigint;
+  dropped bigint := 0;
+BEGIN
+  IF p_table NOT IN ('api_request_logs', 'audit_logs') THEN
+    RAISE EXCEPTION 'drop_log_partitions_before: unsupported table %', p_table;
+  END IF;
+
+  FOR part IN
+    SELECT c.relname
+    FROM pg_catalog.pg_inherits i
+    JOIN pg_catalog.pg_class c ON c.oid = i.inhrelid
+    JOIN pg_catalog.pg_class p ON p.oid = i.inhparent
+    JOIN pg_catalog.pg_namespace n ON n.oid = p.relnamespace
+    WHERE n.nspname = 'public'
+      AND p.relname = p_table
+      AND c.relname ~ ('^' || p_table || '_p[0-9]{8}$')
+      AND (to_date(right(c.relname, 8), 'YYYYMMDD') + 1)::timestamptz <= p_cutoff
+  LOOP
+    EXECUTE format('SELECT count(*) FROM public.%I', part.relname) INTO part_rows;
+    EXECUTE format('DROP TABLE public.%I', part.relname);
+    dropped := dropped + part_rows;
+  END LOOP;
+  RETURN dropped;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.ensure_log_partitions(text, date, date) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.ensure_log_partitions(text, date, date) TO service_role;
+REVOKE EXECUTE ON FUNCTION public.drop_log_partitions_before(text, timestamptz) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.drop_log_partitions_before(text, timestamptz) TO service_role;
+
+-- ============================================
+-- 2. api_request_logs
+-- ============================================
+
+ALTER TABLE public.api_request_logs RENAME TO api_request_logs_legacy;
+
+CREATE TABLE public.api_request_logs (
+  id uuid DEFAULT extensions.uuid_generate_v4() NOT NULL,
+  user_id uuid REFERENCES auth.users(id) ON DELETE SET NULL,
+  method text NOT NULL,
+  path text NOT NULL,
+  status_code integer,
+  response_time_ms integer,
+  ip_address text,
+  user_agent text,
+  request_body jsonb,
+  error_message text,
+  created_at timestamptz DEFAULT now() NOT NULL,
+  PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- Catch-all for rows outside the pre-created daily range
+CREATE TABLE public.api_request_logs_default PARTITION OF public.api_request_logs DEFAULT;
+
+SELECT public.ensure_log_partitions(
+  'api_request_logs',
+  LEAST(
+    COALESCE((SELECT min(created_at)::date FROM public.api_request_logs_legacy), current_date),
+    current_date
+  ),
+  current_date + 7
+);
+
+INSERT INTO public.api_request_logs (
+  id, user_id, method, path, status_code, response_time_ms,
+  ip_address, user_agent, request_body, error_message, created_at
+)
+SELECT
+  id, user_id, method, path, status_code, response_time_ms,
+  ip_address, user_agent, request_body, error_message, COALESCE(created_at, now())
+FROM public.api_request_logs_legacy;
+
+DROP TABLE public.api_request_logs_legacy;
+
+-- Indexes are declared on the parent and propagate to every partition
+CREATE INDEX "idx_api_logs_created_at" ON public.api_request_logs USING btree (created_at DESC);
+CREATE INDEX "idx_api_logs_created_at_id" ON public.api_request_logs USING btree (created_at DESC, id DESC);
+CREATE INDEX "idx_api_logs_path" ON public.api_request_logs USING btree (path);
+CREATE INDEX "idx_api_logs_path_trgm" ON public.api_request_logs USING gin (path extensions.gin_trgm_ops);
+CREATE INDEX "idx_api_logs_user_id" ON public.api_request_logs USING btree (user_id);
+
+ALTER TABLE public.api_request_logs OWNER TO postgres;
+ALTER TABLE public.api_request_logs ENABLE ROW LEVEL SECURITY;
+GRANT ALL ON TABLE public.api_request_logs TO anon;
+GRANT ALL ON TABLE public.api_request_logs TO authenticated;
+GRANT ALL ON TABLE public.api_request_logs TO service_role;
+
+-- ============================================
+-- 3. audit_logs
+-- ============================================
+
+ALTER TABLE public.audit_logs RENAME TO audit_logs_legacy;
+DROP POLICY IF EXISTS "Service role only" ON public.audit_logs_legacy;
+
+CREATE TABLE public.audit_logs (
+  id uuid DEFAULT gen_random_uuid() NOT NULL,
+  event_type text NOT NULL,
+  user_id uuid REFERENCES auth.users(id),
+  details jsonb DEFAULT '{}'::jsonb,
+  ip_address text,
+  created_at timestamptz DEFAULT now() NOT NULL,
+  PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE public.audit_logs_default PARTITION OF public.audit_logs DEFAULT;
+
+SELECT public.ensure_log_partitions(
+  'audit_logs',
+  LEAST(
+    COALESCE((SELECT min(created_at)::date FROM public.audit_logs_legacy), current_date),
+    current_date
+  ),
+  current_date + 7
+);
+
+INSERT INTO public.audit_logs (id, event_type, user_id, details, ip_address, created_at)
+SELECT id, event_type, user_id, details, ip_address, COALESCE(created_at, now())
+FROM public.audit_logs_legacy;
+
+DROP TABLE public.audit_logs_legacy;
+
+CREATE INDEX "idx_audit_logs_created_at" ON public.audit_logs USING btree (created_at DESC);
+CREATE INDEX "idx_audit_logs_event_type" ON public.audit_logs USING btree (event_type);
+CREATE INDEX "idx_audit_logs_user_id" ON public.audit_logs USING btree (user_id);
+
+ALTER TABLE public.audit_logs OWNER TO postgres;
+ALTER TABLE public.audit_logs ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "Service role only" ON public.audit_logs USING ((auth.role() = 'service_role'::text));
+GRANT ALL ON TABLE public.audit_logs TO anon;
+GRANT ALL ON TABLE public.audit_logs TO authenticated;
+GRANT ALL ON TABLE public.audit_logs TO service_role;
+
+-- ============================================
+-- 4. Scheduled maintenance (pg_cron)
+-- ============================================
+
+-- Keep a week of future partitions, created daily at 00:15 UTC. Starts at
+-- tomorrow so the job never has to split today's live partition range.
+SELECT cron.schedule(
+  'create-log-partitions',
+  '15 0 * * *',
+  $$SELECT public.ensure_log_partitions('api_request_logs', current_date + 1, current_date + 8);
+    SELECT public.ensure_log_partitions('audit_logs', current_date + 1, current_date + 8);$$
+);
+
+-- Retention now drops whole partitions (same 30 / 90 day windows as before)
+SELECT cron.unschedule('cleanup-api-request-logs');
+SELECT cron.unschedule('cleanup-audit-logs');
+
+SELECT cron.schedule(
+  'cleanup-api-request-logs',
+  '0 3 * * 0',
+  $$SELECT public.drop_log_partitions_before('api_request_logs', NOW() - INTERVAL '30 days');
+    DELETE FROM public.api_request_logs_default WHERE created_at < NOW() - INTERVAL '30 days';$$
+);
+
+SELECT cron.schedule(
+  'cleanup-audit-logs',
+  '5 3 * * 0',
+  $$SELECT public.drop_log_partitions_before('audit_logs', NOW() - INTERVAL '90 days');
+    DELETE FROM public.audit_logs_default WHERE created_at < NOW() - INTERVAL '90 days';$$
+);
@@ -0,0 +1,96 @@
+-- Day-granularity rollup of audit events for the admin stats endpoints.
+--
+-- daily_event_counts used to GROUP BY the raw audit_logs stream on every call.
+-- Closed days are now read from admin_daily_event_counts (one row per day and
+-- event type, refreshed hourly by pg_cron); only yesterday and today are still
+-- counted from audit_logs. The rollup also outlives the 90-day log retention,
+-- so 365-day windows stay complete.
+
+CREATE TABLE IF NOT EXISTS public.admin_daily_event_counts (
+  day date NOT NULL,
+  event_type text NOT NULL,
+  n bigint NOT NULL,
+  PRIMARY KEY (day, event_type)
+);
+
+ALTER TABLE public.admin_daily_event_counts OWNER TO postgres;
+ALTER TABLE public.admin_daily_event_counts ENABLE ROW LEVEL SECURITY;
+GRANT ALL ON TABLE public.admin_daily_event_counts TO service_role;
+
+-- Recompute the rollup for UTC days in [p_from, p_to)
+CREATE OR REPLACE FUNCTION public.refresh_admin_daily_event_counts(
+  p_from date,
+  p_to date
+)
+RETURNS void
+LANGUAGE sql
+AS $$
+  INSERT INTO public.admin_daily_event_counts (day, event_type, n)
+  SELECT (created_at AT TIME ZONE 'UTC')::date, event_type, count(*)
+  FROM public.audit_logs
+  WHERE created_at >= (p_from::timestamp AT TIME ZONE 'UTC')
+    AND created_at < (p_to::timestamp AT TIME ZONE 'UTC')
+  GROUP BY 1, 2
+  ON CONFLICT (day, event_type) DO UPDATE SET n = EXCLUDED.n
+$$;
+
+-- Per-day counts of one audit event type since a cutoff (UTC days): whole
+-- closed days after the cutoff day come from the rollup; the partial cutoff
+-- day (from p_cutoff on) and the last two days are counted from audit_logs,
+-- so the window starts exactly at p_cutoff. A cutoff day older than the 90-day
+-- audit_logs retention has no raw rows left and reports only what remains.
+CREATE OR REPLACE FUNCTION public.daily_event_counts(
+  p_event_type text,
+  p_cutoff timestamptz
+)
+RETURNS TABLE (d date, n bigint)
+LANGUAGE sql
+STABLE
+AS $$
+  WITH bounds AS (
+    SELECT
+      (p_cutoff AT TIME ZONE 'UTC')::date AS cutoff_day,
+      (now() AT TIME ZONE 'UTC')::date - 1 AS raw_from
+  )
+  SELECT r.day AS d, r.n
+  FROM public.admin_daily_event_counts r, bounds b
+  WHERE r.event_type = p_event_type
+    AND r.day > b.cutoff_day
+    AND r.day < b.raw_from
+  UNION ALL
+  SELECT (a.created_at AT TIME ZONE 'UTC')::date AS d, count(*) AS n
+  FROM public.audit_logs a, bounds b
+  WHERE a.event_type = p_event_type
+    AND a.created_at >= p_cutoff
+    AND a.created_at < LEAST(
+      (b.cutoff_day + 1)::timestamp AT TIME ZONE 'UTC',
+      b.raw_from::timestamp AT TIME ZONE 'UTC'
+    )
+  GROUP BY 1
+  UNION ALL
+  SELECT (a.created_at AT TIME ZONE 'UTC')::date AS d, count(*) AS n
+  FROM public.audit_logs a, bounds b
+  WHERE a.event_type = p_event_type
+    AND a.created_at >= GREATEST(p_cutoff, b.raw_from::timestamp AT TIME ZONE 'UTC')
+  GROUP BY 1
+  ORDER BY 1
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.refresh_admin_daily_event_counts(date, date) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.refresh_admin_daily_event_counts(date, date) TO service_role;
+
+-- Backfill every closed day still present in audit_logs
+SELECT public.refresh_admin_daily_event_counts(
+  date '1970-01-01',
+  (now() AT TIME ZONE 'UTC')::date
+);
+
+-- Hourly: recompute the last three closed days (covers late-arriving rows)
+SELECT cron.schedule(
+  'refresh-admin-daily-event-counts',
+  '7 * * * *',
+  $$SELECT public.refresh_admin_daily_event_counts(
+      (now() AT TIME ZONE 'UTC')::date - 3,
+      (now() AT TIME ZONE 'UTC')::date
+    );$$
+);
@@ -0,0 +1,40 @@
+-- Composite indexes matching the admin query predicates.
+--
+-- The log tables are partitioned, and CREATE INDEX CONCURRENTLY is not
+-- supported on a partitioned parent, so these are plain CREATE INDEX
+-- (built per partition; each daily partition is small).
+
+-- daily_event_counts / event_user_counts / refresh rollup:
+-- WHERE event_type = ? AND created_at >= ?
+CREATE INDEX IF NOT EXISTS "idx_audit_logs_event_type_created_at"
+  ON "public"."audit_logs" USING "btree" ("event_type", "created_at" DESC);
+
+-- Prefix of the composite above
+DROP INDEX IF EXISTS "public"."idx_audit_logs_event_type";
+
+-- admin_overview_stats / avg_response_time_since / active_user_count_since:
+-- created_at range scans that only read response_time_ms and user_id,
+-- so they can be answered index-only
+CREATE INDEX IF NOT EXISTS "idx_api_logs_created_at_covering"
+  ON "public"."api_request_logs" USING "btree" ("created_at" DESC)
+  INCLUDE ("response_time_ms", "user_id");
+
+DROP INDEX IF EXISTS "public"."idx_api_logs_created_at";
+
+-- /admin/api-logs filters, all ordered by created_at DESC
+CREATE INDEX IF NOT EXISTS "idx_api_logs_user_id_created_at"
+  ON "public"."api_request_logs" USING "btree" ("user_id", "created_at" DESC);
+
+DROP INDEX IF EXISTS "public"."idx_api_logs_user_id";
+
+CREATE INDEX IF NOT EXISTS "idx_api_logs_status_code_created_at"
+  ON "public"."api_request_logs" USING "btree" ("status_code", "created_at" DESC);
+
+CREATE INDEX IF NOT EXISTS "idx_api_logs_method_created_at"
+  ON "public"."api_request_logs" USING "btree" ("method", "created_at" DESC);
+
+-- Admin-only lookups (e.g. listing admins); per-user is_admin checks already
+-- use the user_settings_user_id_key unique index
+CREATE INDEX IF NOT EXISTS "idx_user_settings_admin"
+  ON "public"."user_settings" USING "btree" ("user_id")
+  WHERE "is_admin";
@@ -0,0 +1,37 @@
+-- Mirror user_settings.is_admin into auth.users.raw_app_meta_data so it is
+-- issued as the app_metadata.is_admin JWT claim. The API trusts a verified
+-- true claim without a user_settings lookup; a missing/false claim still falls
+-- back to the table, so newly promoted admins work before their token refreshes.
+-- Demotions take effect once the user's access token expires.
+
+CREATE OR REPLACE FUNCTION public.sync_is_admin_app_metadata()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+BEGIN
+  UPDATE auth.users
+  SET raw_app_meta_data =
+    COALESCE(raw_app_meta_data, '{}'::jsonb)
+    || jsonb_build_object('is_admin', COALESCE(NEW.is_admin, false))
+  WHERE id = NEW.user_id;
+  RETURN NEW;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.sync_is_admin_app_metadata() FROM PUBLIC, anon, authenticated;
+
+DROP TRIGGER IF EXISTS "sync_is_admin_app_metadata" ON "public"."user_settings";
+CREATE TRIGGER "sync_is_admin_app_metadata"
+  AFTER INSERT OR UPDATE OF "is_admin" ON "public"."user_settings"
+  FOR EACH ROW
+  EXECUTE FUNCTION public.sync_is_admin_app_metadata();
+
+-- Backfill existing users
+UPDATE auth.users u
+SET raw_app_meta_data =
+  COALESCE(u.raw_app_meta_data, '{}'::jsonb)
+  || jsonb_build_object('is_admin', COALESCE(s.is_admin, false))
+FROM public.user_settings s
+WHERE s.user_id = u.id;
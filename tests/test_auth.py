@@ -0,0 +1,51 @@
+"""Tests for remote token verification caching."""
+
+import time
+from types import SimpleNamespace
+
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+from api.routers import auth
+
+
+def _credentials(expires_in: float) -> HTTPAuthorizationCredentials:
+    token = jwt.encode(
+        {"sub": "user-1", "exp": int(time.time() + expires_in)}, "not-the-secret"
+    )
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def test_remote_verification_cache_stops_at_token_expiry(monkeypatch):
+    calls = []
+    clock = [0.0]
+
+    def get_user(token):
+        calls.append(token)
+        return SimpleNamespace(user=SimpleNamespace(id="user-1", email="u@example.com"))
+
+    monkeypatch.setattr(auth, "decode_supabase_jwt", lambda token: None)
+    monkeypatch.setattr(
+        auth,
+        "get_supabase_auth_client",
+        lambda: SimpleNamespace(auth=SimpleNamespace(get_user=get_user)),
+    )
+    monkeypatch.setattr(
+        auth,
+        "_verified_user_cache",
+        auth.TLRUCache(maxsize=16, ttu=auth._verified_user_ttu, timer=lambda: clock[0]),
+    )
+
+    long_lived = _credentials(3600)
+    expiring = _credentials(10)
+    expired = _credentials(-10)
+    for credentials in (long_lived, expiring, expired):
+        auth.get_current_user(credentials)
+    assert len(calls) == 3
+
+    clock[0] = 20  # Past the expiring token's exp, within AUTH_CACHE_TTL
+    for credentials in (long_lived, expiring, expired):
+        assert auth.get_current_user(credentials)["id"] == "user-1"
+
+    # Only the long-lived token was still served from the cache
+    assert calls[3:] == [expiring.credentials, expired.credentials]
@@ -0,0 +1,49 @@
+"""Tests for the upstream thread pool helper."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from api.services.blocking import run
+
+
+def test_run_executes_off_the_event_loop_thread():
+    def blocking_call(value, *, scale):
+        return value * scale, threading.current_thread().name
+
+    async def main():
+        return await run(blocking_call, 3, scale=2), threading.current_thread().name
+
+    (result, worker), loop_thread = asyncio.run(main())
+
+    assert result == 6
+    assert worker != loop_thread
+    assert worker.startswith("upstream")
+
+
+def test_run_intervals_limits_concurrent_calls_per_user(monkeypatch):
+    import api.services.blocking as blocking
+
+    active = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def fake_with_own_client(config, call):
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        return call(None)
+
+    monkeypatch.setattr(blocking, "_with_own_client", fake_with_own_client)
+    config = SimpleNamespace(athlete_id="i1")
+
+    async def main():
+        return await asyncio.gather(
+            *[blocking.run_intervals("u1", config, lambda c, i=i: i) for i in range(10)]
+        )
+
+    assert asyncio.run(main()) == list(range(10))
+    assert active["max"] <= blocking.PER_USER_UPSTREAM_LIMIT
@@ -0,0 +1,193 @@
+"""Tests for cache_service request coalescing and stale fallback."""
+
+import asyncio
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from api.services import cache_service
+
+
+@pytest.fixture(autouse=True)
+def _reset_caches():
+    cache_service.clear_all_caches()
+    yield
+    cache_service.clear_all_caches()
+
+
+def test_get_or_compute_coalesces_concurrent_misses():
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"value": len(calls)}
+
+    async def run():
+        return await asyncio.gather(
+            *[cache_service.get_or_compute("user-1", "fitness", loader) for _ in range(5)]
+        )
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert all(result == {"value": 1} for result in results)
+    assert cache_service.get_cached("user-1", "fitness") == {"value": 1}
+
+
+def test_cancelled_leader_does_not_fail_joined_requests():
+    async def loader():
+        await asyncio.sleep(0.02)
+        return {"ctl": 50}
+
+    async def run():
+        leader = asyncio.create_task(
+            cache_service.get_or_compute("user-1", "fitness", loader)
+        )
+        await asyncio.sleep(0)
+        joiner = asyncio.create_task(
+            cache_service.get_or_compute("user-1", "fitness", loader)
+        )
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await joiner, leader.cancelled()
+
+    assert asyncio.run(run()) == ({"ctl": 50}, True)
+    assert cache_service.get_cached("user-1", "fitness") == {"ctl": 50}
+
+
+def test_get_or_compute_serves_stale_value_when_loader_fails():
+    async def ok():
+        return {"ctl": 50}
+
+    async def failing():
+        raise RuntimeError("upstream down")
+
+    asyncio.run(cache_service.get_or_compute("user-1", "fitness", ok))
+    stale = asyncio.run(
+        cache_service.get_or_compute("user-1", "fitness", failing, refresh=True)
+    )
+    assert stale == {"ctl": 50}
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(cache_service.get_or_compute("user-1", "calendar", failing))
+
+    # A full clear drops the stale fallback too
+    cache_service.clear_user_cache("user-1")
+    with pytest.raises(RuntimeError):
+        asyncio.run(
+            cache_service.get_or_compute("user-1", "fitness", failing, refresh=True)
+        )
+
+
+def test_ttl_policy_follows_key_and_generation_time():
+    assert cache_service.get_ttl_policy("sport_settings:Ride") == "long"
+    assert cache_service.get_ttl_policy("fitness:profile") == "long"
+    assert cache_service.get_ttl_policy("fitness:complete") == "normal"
+    assert cache_service.get_ttl_policy("activities:30") == "short"
+    assert cache_service.get_ttl_policy("unknown") == "normal"
+
+    min_ttl, max_ttl = cache_service.TTL_POLICIES["short"]
+    assert cache_service.compute_ttl("short", gen_ms=0) == min_ttl
+    assert min_ttl < cache_service.compute_ttl("short", gen_ms=1500) <= max_ttl
+    assert cache_service.compute_ttl("short", gen_ms=10**7) == max_ttl
+
+
+def test_get_or_compute_json_caches_serialized_body():
+    class Payload(BaseModel):
+        ctl: float
+
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return Payload(ctl=42.5)
+
+    first = asyncio.run(cache_service.get_or_compute_json("user-1", "fitness", loader))
+    second = asyncio.run(cache_service.get_or_compute_json("user-1", "fitness", loader))
+
+    assert len(calls) == 1
+    assert first.body == second.body == b'{"ctl":42.5}'
+    assert second.media_type == "application/json"
+    assert cache_service.get_cached("user-1", "fitness").body == b'{"ctl":42.5}'
+
+
+def test_get_or_compute_json_returns_304_for_matching_etag():
+    class Payload(BaseModel):
+        ctl: float
+
+    async def loader():
+        return Payload(ctl=42.5)
+
+    first = asyncio.run(cache_service.get_or_compute_json("user-1", "fitness", loader))
+    etag = first.headers["etag"]
+
+    not_modified = asyncio.run(
+        cache_service.get_or_compute_json(
+            "user-1", "fitness", loader, if_none_match=f"W/{etag}"
+        )
+    )
+    changed = asyncio.run(
+        cache_service.get_or_compute_json(
+            "user-1", "fitness", loader, if_none_match='"stale"'
+        )
+    )
+
+    assert not_modified.status_code == 304
+    assert not_modified.body == b""
+    assert not_modified.headers["etag"] == etag
+    assert changed.status_code == 200
+    assert changed.body == b'{"ctl":42.5}'
+
+
+def test_user_cache_map_is_bounded(monkeypatch):
+    monkeypatch.setattr(cache_service, "_user_caches", cache_service.LFUCache(maxsize=2))
+
+    cache_service.set_cached("user-1", "fitness", 1)
+    cache_service.get_cached("user-1", "fitness")
+    cache_service.set_cached("user-2", "fitness", 2)
+    cache_service.set_cached("user-3", "fitness", 3)
+
+    # The frequently used user survives; the least used one was evicted
+    assert set(cache_service._user_caches) == {"user-1", "user-3"}
+    assert cache_service.get_cached("user-1", "fitness") == 1
+
+
+def test_expired_entry_is_served_while_revalidating():
+    ttl = 600
+    cache_service._stale_values[("user-1", "fitness")] = cache_service._CacheEntry(
+        "old", "normal", ttl, time.time() - ttl * 1.5
+    )
+
+    async def loader():
+        return "new"
+
+    async def run():
+        value, status = await cache_service.get_or_compute_with_status(
+            "user-1", "fitness", loader
+        )
+        await asyncio.gather(*cache_service._background_refreshes)
+        return value, status
+
+    assert asyncio.run(run()) == ("old", "stale")
+    assert cache_service.get_cached("user-1", "fitness") == "new"
+
+    # Explicit invalidation stops the old value from being served while
+    # revalidating
+    cache_service.clear_user_cache("user-1", keys=["fitness"])
+    assert asyncio.run(
+        cache_service.get_or_compute_with_status("user-1", "fitness", loader)
+    ) == ("new", "miss")
+
+
+def test_clear_user_cache_clears_sub_keys():
+    cache_service.set_cached("user-1", "calendar:2026-10-12", "week")
+    cache_service.set_cached("user-1", "calendar_other", "kept")
+    cache_service.set_cached("user-1", "fitness:complete", "kept")
+
+    cache_service.clear_user_cache("user-1", keys=["calendar"])
+
+    assert cache_service.get_cached("user-1", "calendar:2026-10-12") is None
+    assert cache_service.get_cached("user-1", "calendar_other") == "kept"
+    assert cache_service.get_cached("user-1", "fitness:complete") == "kept"
@@ -10,6 +10,7 @@ from api.schemas import WorkoutGenerateRequest
 from api.services.fitness_snapshot_service import (
     FitnessSnapshot,
     get_fitness_snapshot,
+    select_sport_settings,
 )
 from src.config import UserProfile
 from src.services.data_processor import TrainingMetrics, WellnessMetrics
@@ -20,6 +21,18 @@ fake_supabase.Client = object
 sys.modules.setdefault("supabase", fake_supabase)
 
 
+def test_select_sport_settings_prefers_first_match_then_first_entry():
+    run = {"types": ["Run"], "ftp": 1}
+    ride = {"types": ["Ride", "VirtualRide"], "ftp": 250}
+    ride_dup = {"types": ["Ride"], "ftp": 999}
+    athlete_data = {"sportSettings": [run, ride, ride_dup]}
+
+    assert select_sport_settings(athlete_data, "Ride") is ride
+    assert select_sport_settings(athlete_data, "VirtualRide") is ride
+    assert select_sport_settings(athlete_data, "Swim") is run
+    assert select_sport_settings({}, "Ride") == {}
+
+
 def test_get_fitness_snapshot_reuses_cache(monkeypatch):
     cache = {}
     fetch_calls = []
@@ -216,10 +229,7 @@ def test_generate_workout_uses_shared_snapshot_instead_of_raw_fetch(monkeypatch)
     monkeypatch.setattr(workout_mod, "get_data_processor", lambda: object())
     monkeypatch.setattr(workout_mod, "get_fitness_snapshot", fake_snapshot)
     monkeypatch.setattr(workout_mod, "get_recent_profile_ids", lambda *args: [])
-    monkeypatch.setattr(
-        "src.clients.supabase_client.get_supabase_admin_client",
-        lambda: object(),
-    )
+    monkeypatch.setattr(workout_mod, "get_supabase_admin_client", lambda: object())
     monkeypatch.setattr(workout_mod, "increment_usage", AsyncMock())
     monkeypatch.setattr(workout_mod, "log_audit_event", AsyncMock())
     monkeypatch.setattr(workout_mod, "WorkoutGenerator", FakeGenerator)
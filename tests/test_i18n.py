@@ -0,0 +1,27 @@
+"""Tests for the API i18n helpers."""
+
+from api.i18n import get_language, t
+
+
+def test_t_resolves_nested_key_per_language():
+    assert t("auth.invalidToken") == "Invalid token"
+    assert t("auth.invalidToken", lang="ko") != "Invalid token"
+
+
+def test_t_formats_kwargs():
+    assert t("auth.authFailed", error="boom") == "Authentication failed: boom"
+
+
+def test_t_falls_back_to_english_then_key():
+    assert t("auth.invalidToken", lang="fr") == "Invalid token"
+    assert t("does.not.exist") == "does.not.exist"
+    assert t("auth") == "auth"
+
+
+def test_get_language_from_accept_language():
+    assert get_language(None) == "en"
+    assert get_language("") == "en"
+    assert get_language("ko-KR,ko;q=0.9,en-US;q=0.8") == "ko"
+    assert get_language("en-US,en;q=0.9") == "en"
+    assert get_language("fr-FR, ko;q=0.5") == "ko"
+    assert get_language("fr-FR") == "en"
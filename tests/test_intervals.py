@@ -32,6 +32,16 @@ class TestIntervalsClient:
         assert client.config == config
         assert client.base_url == "https://intervals.icu/api/v1"
 
+    def test_clients_share_connection_pool(self, client, config):
+        """Sessions reuse one adapter, and closing a session keeps it open."""
+        other = IntervalsClient(config)
+        adapter = client.session.get_adapter("https://intervals.icu")
+
+        assert other.session.get_adapter("https://intervals.icu") is adapter
+
+        other.session.close()
+        assert client.session.get_adapter("https://intervals.icu") is adapter
+
     def test_format_date_string(self, client):
         """Test date formatting with string input."""
         result = client._format_date("2024-12-15")
@@ -84,6 +94,25 @@ class TestIntervalsClient:
         assert len(wellness) == 1
         assert wellness[0]["hrv"] == 55
 
+    @patch("src.clients.intervals.requests.Session")
+    def test_get_events_forwards_category_filter(self, mock_session_class, config):
+        """Test that the category filter is sent to Intervals.icu."""
+        mock_session = MagicMock()
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = [{"id": 7, "category": "WORKOUT"}]
+        mock_session.request.return_value = mock_response
+        mock_session_class.return_value = mock_session
+
+        client = IntervalsClient(config)
+        client.session = mock_session
+
+        events = client.get_events("2024-12-09", "2024-12-15", category="WORKOUT")
+
+        assert events == [{"id": 7, "category": "WORKOUT"}]
+        params = mock_session.request.call_args.kwargs["params"]
+        assert params["category"] == "WORKOUT"
+
     @patch("src.clients.intervals.requests.Session")
     def test_create_workout(self, mock_session_class, config):
         """Test creating a workout."""
@@ -0,0 +1,47 @@
+"""Tests for the request log batch writer."""
+
+import asyncio
+
+from api import middleware
+
+
+def test_failed_batch_is_retried_row_by_row(monkeypatch):
+    inserted = []
+
+    def fake_insert(rows):
+        if len(rows) > 1 or rows[0]["path"] == "/bad":
+            raise RuntimeError("insert failed")
+        inserted.extend(rows)
+
+    monkeypatch.setattr(middleware, "_insert_logs", fake_insert)
+
+    middleware._write_batch([{"path": "/a"}, {"path": "/bad"}, {"path": "/b"}])
+
+    assert inserted == [{"path": "/a"}, {"path": "/b"}]
+
+
+def test_stop_log_writer_flushes_queued_and_pending_rows(monkeypatch):
+    inserted = []
+    monkeypatch.setattr(middleware, "_insert_logs", inserted.extend)
+    # start_log_writer replaces the module queue; restore it afterwards
+    monkeypatch.setattr(middleware, "_log_queue", None)
+
+    async def main():
+        writer = middleware.start_log_writer()
+
+        async def late_log():
+            await asyncio.sleep(0.01)
+            middleware._log_queue.put_nowait({"path": "/late"})
+
+        task = asyncio.create_task(late_log())
+        middleware._pending_tasks.add(task)
+        task.add_done_callback(middleware._pending_tasks.discard)
+        middleware._log_queue.put_nowait({"path": "/queued"})
+
+        await middleware.stop_log_writer(writer)
+        return writer
+
+    writer = asyncio.run(main())
+
+    assert writer.cancelled()
+    assert sorted(row["path"] for row in inserted) == ["/late", "/queued"]
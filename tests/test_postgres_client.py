@@ -0,0 +1,21 @@
+"""Tests for the optional direct Postgres pool."""
+
+import asyncio
+import sys
+import types
+
+from src.clients import postgres_client
+
+
+def test_init_pg_pool_falls_back_when_connection_fails(monkeypatch):
+    async def failing_create_pool(**kwargs):
+        raise OSError("connection refused")
+
+    fake_asyncpg = types.ModuleType("asyncpg")
+    fake_asyncpg.create_pool = failing_create_pool
+    monkeypatch.setitem(sys.modules, "asyncpg", fake_asyncpg)
+    monkeypatch.setattr(postgres_client, "SUPABASE_DB_URL", "postgresql://db.invalid/x")
+    monkeypatch.setattr(postgres_client, "_pool", None)
+
+    assert asyncio.run(postgres_client.init_pg_pool()) is None
+    assert postgres_client.get_pg_pool() is None
@@ -81,3 +81,72 @@ def test_get_user_profile_maps_training_style_and_focus(monkeypatch):
     assert profile.training_style == "polarized"
     assert profile.training_focus == "build"
     assert profile.ftp == 252
+
+
+class _RecordingQuery:
+    def __init__(self, store, data):
+        self._store = store
+        self._data = data
+
+    def select(self, _fields):
+        return self
+
+    def eq(self, _key, _value):
+        return self
+
+    def in_(self, key, values):
+        self._store.setdefault("in", []).append((key, list(values)))
+        return self
+
+    def upsert(self, rows, on_conflict=None):
+        self._store.setdefault("upserts", []).append((rows, on_conflict))
+        return self
+
+    def execute(self):
+        return types.SimpleNamespace(data=self._data)
+
+
+class _RecordingSupabase:
+    def __init__(self, existing):
+        self.store = {}
+        self._existing = existing
+
+    def table(self, _name):
+        return _RecordingQuery(self.store, self._existing)
+
+
+def test_sync_workouts_from_intervals_batches_reads_and_upserts(monkeypatch):
+    from api.services.user_api_service import sync_workouts_from_intervals
+
+    supabase = _RecordingSupabase(
+        [
+            {
+                "workout_date": "2026-03-02",
+                "design_goal": "Keep threshold",
+                "workout_type": "VirtualRide",
+            }
+        ]
+    )
+    monkeypatch.setattr(
+        "api.services.user_api_service.get_supabase_admin_client", lambda: supabase
+    )
+
+    events = [
+        {"id": 1, "start_date_local": "2026-03-02T06:00:00", "name": "Old", "type": "Ride"},
+        {"id": 2, "start_date_local": "2026-03-02T18:00:00", "name": "New", "moving_time": 3600},
+        {"id": 3, "start_date_local": "2026-03-04T06:00:00", "name": "Tempo"},
+    ]
+
+    asyncio.run(sync_workouts_from_intervals("user-1", events))
+
+    assert supabase.store["in"] == [("workout_date", ["2026-03-02", "2026-03-04"])]
+    [(rows, on_conflict)] = supabase.store["upserts"]
+    assert on_conflict == "user_id, workout_date"
+    by_date = {row["workout_date"]: row for row in rows}
+    # Last event per date wins, existing metadata is preserved
+    assert by_date["2026-03-02"]["intervals_event_id"] == 2
+    assert by_date["2026-03-02"]["duration_minutes"] == 60
+    assert by_date["2026-03-02"]["design_goal"] == "Keep threshold"
+    assert by_date["2026-03-02"]["workout_type"] == "VirtualRide"
+    assert by_date["2026-03-04"]["design_goal"] is None
+    assert by_date["2026-03-04"]["workout_type"] == "Ride"